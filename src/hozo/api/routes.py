@@ -1,6 +1,5 @@
 """FastAPI routes for the Hōzō web UI and API."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Optional
@@ -534,13 +533,15 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         return _tpl(request, "auth/login.html", {"next": next_url, "has_credentials": True})
 
     @app.post("/auth/login/begin")
-    async def post_login_begin(request: Request) -> JSONResponse:
+    async def post_login_begin(request: Request) -> Response:
         creds = app.state.auth.get("credentials", [])
         stored = [StoredCredential.from_dict(c) for c in creds]
         rp_id = app.state.auth.get("rp_id", "localhost")
         options_json, challenge = begin_authentication(rp_id, stored)
         store_challenge(app.state.pending_challenges, challenge)
-        return JSONResponse(json.loads(options_json))
+        # options_json is already serialized — pass it through instead of
+        # parsing and re-encoding it via JSONResponse
+        return Response(content=options_json, media_type="application/json")
 
     @app.post("/auth/login/complete")
     async def post_login_complete(request: Request) -> JSONResponse:
@@ -549,13 +550,11 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         stored = [StoredCredential.from_dict(c) for c in creds]
         rp_id = app.state.auth.get("rp_id", "localhost")
         origin = _detect_origin(request, rp_id)
-        import base64
 
         # Find matching challenge — use the only pending one
         if not app.state.pending_challenges:
             return JSONResponse({"error": "No pending challenge"}, status_code=400)
-        challenge = list(app.state.pending_challenges.keys())[0]
-        challenge_bytes = base64.urlsafe_b64decode(challenge + "==")
+        challenge_bytes = next(iter(app.state.pending_challenges))
         try:
             pop_challenge(app.state.pending_challenges, challenge_bytes)
             updated = complete_authentication(body.decode(), challenge_bytes, rp_id, origin, stored)
@@ -599,11 +598,11 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         return _tpl(request, "auth/register.html", {"rp_id": rp_id, "is_bootstrap": is_bootstrap})
 
     @app.post("/auth/register/begin")
-    async def post_register_begin(request: Request) -> JSONResponse:
+    async def post_register_begin(request: Request) -> Response:
         rp_id = app.state.auth.get("rp_id", "localhost")
         options_json, challenge = begin_registration(rp_id, "Hōzō")
         store_challenge(app.state.pending_challenges, challenge)
-        return JSONResponse(json.loads(options_json))
+        return Response(content=options_json, media_type="application/json")
 
     @app.post("/auth/register/complete")
     async def post_register_complete(request: Request) -> JSONResponse:
@@ -613,10 +612,7 @@ def create_app(config_path: Optional[str] = None) -> FastAPI:
         device_name = request.headers.get("x-device-name", "My Device")
         if not app.state.pending_challenges:
             return JSONResponse({"error": "No pending challenge"}, status_code=400)
-        challenge_key = list(app.state.pending_challenges.keys())[0]
-        import base64
-
-        challenge_bytes = base64.urlsafe_b64decode(challenge_key + "==")
+        challenge_bytes = next(iter(app.state.pending_challenges))
         try:
             pop_challenge(app.state.pending_challenges, challenge_bytes)
             cred = complete_registration(body.decode(), challenge_bytes, rp_id, origin, device_name)
@@ -1,6 +1,7 @@
 """Authentication helpers for Hōzō — session management (itsdangerous)."""
 
 import secrets
+from functools import lru_cache
 
 from itsdangerous import BadSignature, SignatureExpired, TimestampSigner
 
@@ -9,6 +10,12 @@ SESSION_VALUE = "authenticated"
 DEFAULT_MAX_AGE = 86400  # 24 hours
 
 
+@lru_cache(maxsize=8)
+def _signer(secret: str) -> TimestampSigner:
+    """One TimestampSigner per secret — construction is per-deployment, not per-request."""
+    return TimestampSigner(secret)
+
+
 def generate_secret() -> str:
     """Generate a cryptographically secure 32-byte hex secret for session signing."""
     return secrets.token_hex(32)
@@ -24,8 +31,7 @@ def make_session_cookie(secret: str) -> str:
     Returns:
         Signed string to set as the cookie value.
     """
-    signer = TimestampSigner(secret)
-    return signer.sign(SESSION_VALUE).decode()
+    return _signer(secret).sign(SESSION_VALUE).decode()
 
 
 def verify_session_cookie(cookie: str, secret: str, max_age: int = DEFAULT_MAX_AGE) -> bool:
@@ -40,9 +46,8 @@ def verify_session_cookie(cookie: str, secret: str, max_age: int = DEFAULT_MAX_A
     Returns:
         True if the cookie is valid and not expired.
     """
-    signer = TimestampSigner(secret)
     try:
-        signer.unsign(cookie, max_age=max_age)
+        _signer(secret).unsign(cookie, max_age=max_age)
         return True
     except (BadSignature, SignatureExpired):
         return False
@@ -2,9 +2,9 @@
 
 import base64
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 import webauthn
 from webauthn.helpers import (
@@ -22,9 +22,13 @@ from webauthn.helpers.structs import (
 CHALLENGE_TTL = 300
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoredCredential:
-    """A WebAuthn credential persisted in config.yaml."""
+    """A WebAuthn credential persisted in config.yaml.
+
+    Frozen so instances are hashable (and usable as dict keys); slotted to
+    skip the per-instance __dict__.
+    """
 
     credential_id: bytes
     public_key: bytes
@@ -32,10 +36,17 @@ class StoredCredential:
     device_name: str
     added_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    @property
+    def id_b64(self) -> str:
+        # slots=True rules out functools.cached_property (no __dict__ to
+        # cache into); credential ids are tens of bytes, so recomputing is
+        # cheaper than growing the instance layout.
+        return _b64url_nopad(self.credential_id)
+
     def to_dict(self) -> dict[str, Any]:
         return {
-            "id": base64.urlsafe_b64encode(self.credential_id).decode().rstrip("="),
-            "public_key": base64.urlsafe_b64encode(self.public_key).decode().rstrip("="),
+            "id": self.id_b64,
+            "public_key": _b64url_nopad(self.public_key),
             "sign_count": self.sign_count,
             "device_name": self.device_name,
             "added_at": self.added_at.isoformat(),
@@ -52,12 +63,20 @@ class StoredCredential:
         )
 
 
+def _b64url_nopad(b: bytes) -> str:
+    """Encode bytes as base64url without padding."""
+    # The padding length is known from len(b), so slice it off instead of
+    # scanning the tail with rstrip("=").
+    pad = -len(b) % 3
+    s = base64.urlsafe_b64encode(b).decode("ascii")
+    return s[:-pad] if pad else s
+
+
 def _b64url_decode(s: str) -> bytes:
     """Decode a base64url string with or without padding."""
-    padding = 4 - len(s) % 4
-    if padding != 4:
-        s += "=" * padding
-    return base64.urlsafe_b64decode(s)
+    # -len(s) % 4 is the padding needed to reach a multiple of 4 (0 if already
+    # aligned), so one expression covers both padded and unpadded input.
+    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
 
 
 def begin_registration(
@@ -156,7 +175,7 @@ def complete_authentication(
     Complete WebAuthn authentication.
 
     Returns:
-        The matching StoredCredential with sign_count already updated.
+        A copy of the matching StoredCredential with sign_count updated.
         The caller must persist the updated sign_count to config.
 
     Raises:
@@ -164,12 +183,9 @@ def complete_authentication(
         Exception: If verification fails.
     """
     credential = parse_authentication_credential_json(body)
-    cred_id_bytes = _b64url_decode(credential.id)
 
-    stored = next(
-        (c for c in stored_credentials if c.credential_id == cred_id_bytes),
-        None,
-    )
+    by_id = {c.credential_id: c for c in stored_credentials}
+    stored = by_id.get(_b64url_decode(credential.id))
     if stored is None:
         raise ValueError(f"No matching credential for id={credential.id!r}")
 
@@ -182,48 +198,58 @@ def complete_authentication(
         credential_current_sign_count=stored.sign_count,
         require_user_verification=True,
     )
-    stored.sign_count = verification.new_sign_count
-    return stored
+    return replace(stored, sign_count=verification.new_sign_count)
 
 
 def store_challenge(
-    pending: dict[str, tuple[bytes, float]],
+    pending: dict[bytes, float],
     challenge: bytes,
+    _now: Callable[[], float] = time.monotonic,
 ) -> None:
     """
     Store a challenge in the pending dict and clean up expired entries.
 
     Args:
-        pending: app.state.pending_challenges dict.
+        pending: app.state.pending_challenges dict, challenge bytes -> expiry.
         challenge: Raw challenge bytes.
+        _now: Monotonic clock, injectable for tests.
     """
-    now = time.monotonic()
-    # Prune expired challenges
-    expired = [k for k, (_, exp) in pending.items() if now > exp]
+    now = _now()
+    # Every entry gets the same TTL, so dict insertion order is also expiry
+    # order: prune from the front and stop at the first live entry instead
+    # of scanning the whole dict on every store.
+    expired = []
+    for k, exp in pending.items():
+        if now <= exp:
+            break
+        expired.append(k)
     for k in expired:
         del pending[k]
-    key = base64.urlsafe_b64encode(challenge).decode()
-    pending[key] = (challenge, now + CHALLENGE_TTL)
+    pending[bytes(challenge)] = now + CHALLENGE_TTL
 
 
 def pop_challenge(
-    pending: dict[str, tuple[bytes, float]],
+    pending: dict[bytes, float],
     challenge: bytes,
+    _now: Callable[[], float] = time.monotonic,
 ) -> bytes:
     """
     Pop and validate a pending challenge.
 
+    Args:
+        pending: app.state.pending_challenges dict, challenge bytes -> expiry.
+        challenge: Raw challenge bytes.
+        _now: Monotonic clock, injectable for tests.
+
     Returns:
         The challenge bytes if valid.
 
     Raises:
         ValueError: If challenge is missing or expired.
     """
-    key = base64.urlsafe_b64encode(challenge).decode()
-    entry = pending.pop(key, None)
-    if entry is None:
+    expires_at = pending.pop(bytes(challenge), None)
+    if expires_at is None:
         raise ValueError("Challenge not found or already used")
-    _, expires_at = entry
-    if time.monotonic() > expires_at:
+    if _now() > expires_at:
         raise ValueError("Challenge expired")
     return challenge
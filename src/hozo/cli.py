@@ -101,10 +101,12 @@ def jobs_run(ctx: click.Context, job_name: str) -> None:
 
     click.echo(f"▶  Running job: {job_name}")
     from hozo.core.job import run_job
-    from hozo.notifications.notify import send_notification
+    from hozo.notifications.notify import flush, send_notification
 
     result = run_job(match)
     send_notification(result, raw)
+    # One-shot process: wait for the queued notification to go out.
+    flush(timeout=15.0)
 
     if result.success:
         click.echo(
@@ -6,6 +6,11 @@ from typing import Any, Optional
 
 import yaml
 
+try:  # libyaml-backed dumper when available (~10x faster than pure Python)
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
 from hozo.core.job import BackupJob
 
 
@@ -56,6 +61,7 @@ def write_config(path: Path, config: dict[str, Any]) -> None:
             yaml.dump(
                 config,
                 f,
+                Dumper=_SafeDumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False,
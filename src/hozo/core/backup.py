@@ -3,14 +3,29 @@
 import logging
 import shlex
 import subprocess
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Boolean option -> syncoid flag, in the order flags appear on the command
+# line. Shared by the push and restore wrappers.
+_SYNCOID_FLAGS: tuple[tuple[str, str], ...] = (
+    ("recursive", "--recursive"),
+    ("no_privilege_elevation", "--no-privilege-elevation"),
+    ("force_delete", "--force-delete"),
+)
+
+
+def _flag_args(**options: bool) -> list[str]:
+    """Return the syncoid flags for the enabled boolean options, in table order."""
+    return [flag for name, flag in _SYNCOID_FLAGS if options.get(name)]
+
 
 class SyncoidError(Exception):
     """Raised when syncoid exits with a non-zero status."""
 
+    __slots__ = ("returncode", "stderr", "stdout")
+
     def __init__(self, returncode: int, stderr: str, stdout: str = "") -> None:
         self.returncode = returncode
         self.stderr = stderr
@@ -28,6 +43,7 @@ def run_syncoid(
     no_privilege_elevation: bool = False,
     dry_run: bool = False,
     syncoid_bin: str = "syncoid",
+    _runner: Callable[..., "subprocess.CompletedProcess[str]"] = subprocess.run,
 ) -> tuple[bool, str]:
     """
     Run syncoid to replicate a ZFS dataset to a remote host.
@@ -42,6 +58,7 @@ def run_syncoid(
         no_privilege_elevation: Pass --no-privilege-elevation to syncoid
         dry_run: If True, print the command without executing it
         syncoid_bin: Path or name of the syncoid binary
+        _runner: subprocess.run-compatible callable, injectable for tests
 
     Returns:
         True if replication succeeded
@@ -51,18 +68,20 @@ def run_syncoid(
         FileNotFoundError: If syncoid is not found in PATH
     """
     cmd = [syncoid_bin]
-
-    if recursive:
-        cmd.append("--recursive")
-    if no_privilege_elevation:
-        cmd.append("--no-privilege-elevation")
-
-    # Build SSH options
-    ssh_opts_parts: list[str] = ["-o StrictHostKeyChecking=no"]
-    if ssh_key:
-        ssh_opts_parts.append(f"-i {ssh_key}")
-    cmd.extend(["--sshcipher", "aes128-ctr"])
-    cmd.extend(["--sshoption", " ".join(ssh_opts_parts)])
+    cmd += _flag_args(recursive=recursive, no_privilege_elevation=no_privilege_elevation)
+
+    # Build SSH options in one pass: conditional tokens are None when unset
+    # and filtered out of the join.
+    ssh_opts = " ".join(
+        filter(
+            None,
+            (
+                "-o StrictHostKeyChecking=no",
+                f"-i {ssh_key}" if ssh_key else None,
+            ),
+        )
+    )
+    cmd.extend(["--sshcipher", "aes128-ctr", "--sshoption", ssh_opts])
 
     source = source_dataset
     target = f"{ssh_user}@{target_host}:{target_dataset}"
@@ -75,7 +94,7 @@ def run_syncoid(
         logger.info("[DRY RUN] Would run: %s", shlex.join(cmd))
         return True, ""
 
-    result = subprocess.run(
+    result = _runner(
         cmd,
         capture_output=True,
         text=True,
@@ -107,6 +126,7 @@ def run_restore_syncoid(
     no_privilege_elevation: bool = False,
     force_delete: bool = True,
     syncoid_bin: str = "syncoid",
+    _runner: Callable[..., "subprocess.CompletedProcess[str]"] = subprocess.run,
 ) -> tuple[bool, str]:
     """
     Run syncoid to pull a ZFS dataset FROM a remote host TO the local machine.
@@ -125,6 +145,7 @@ def run_restore_syncoid(
         no_privilege_elevation: Pass --no-privilege-elevation to syncoid
         force_delete: Pass --force-delete (destroy local snapshots not in source)
         syncoid_bin: Path or name of the syncoid binary
+        _runner: subprocess.run-compatible callable, injectable for tests
 
     Returns:
         (True, combined_output) on success
@@ -133,21 +154,23 @@ def run_restore_syncoid(
         SyncoidError: If syncoid exits with a non-zero status
     """
     cmd = [syncoid_bin]
+    cmd += _flag_args(
+        recursive=recursive,
+        no_privilege_elevation=no_privilege_elevation,
+        force_delete=force_delete,
+    )
 
-    if recursive:
-        cmd.append("--recursive")
-    if no_privilege_elevation:
-        cmd.append("--no-privilege-elevation")
-    if force_delete:
-        cmd.append("--force-delete")
-
-    ssh_opts_parts: list[str] = ["-o StrictHostKeyChecking=no"]
-    if ssh_key:
-        ssh_opts_parts.append(f"-i {ssh_key}")
-    if ssh_port != 22:
-        ssh_opts_parts.append(f"-p {ssh_port}")
-    cmd.extend(["--sshcipher", "aes128-ctr"])
-    cmd.extend(["--sshoption", " ".join(ssh_opts_parts)])
+    ssh_opts = " ".join(
+        filter(
+            None,
+            (
+                "-o StrictHostKeyChecking=no",
+                f"-i {ssh_key}" if ssh_key else None,
+                f"-p {ssh_port}" if ssh_port != 22 else None,
+            ),
+        )
+    )
+    cmd.extend(["--sshcipher", "aes128-ctr", "--sshoption", ssh_opts])
 
     # RESTORE: pull FROM remote backup INTO local dataset
     remote_source = f"{ssh_user}@{target_host}:{target_dataset}"
@@ -157,7 +180,7 @@ def run_restore_syncoid(
 
     logger.info("Running syncoid RESTORE: %s", shlex.join(cmd))
 
-    result = subprocess.run(
+    result = _runner(
         cmd,
         capture_output=True,
         text=True,
@@ -203,4 +226,5 @@ def list_remote_snapshots(
     if exit_code != 0:
         logger.warning("Failed to list snapshots on %s:%s — %s", host, dataset, stderr.strip())
         return []
-    return [line.strip() for line in stdout.splitlines() if line.strip()]
+    # Strip each line once, keeping only the non-empty results
+    return [stripped for line in stdout.splitlines() if (stripped := line.strip())]
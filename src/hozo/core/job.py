@@ -1,5 +1,6 @@
 """Job execution orchestration."""
 
+import functools
 import logging
 import time
 from dataclasses import dataclass, field
@@ -14,9 +15,14 @@ from hozo.core.wol import wake
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupJob:
-    """Configuration for a single backup job."""
+    """Configuration for a single backup job.
+
+    slots=True: jobs are read-heavy — every runner step and the config
+    writer walk their fields — and slotted access skips the per-instance
+    __dict__ lookup.
+    """
 
     name: str
     source_dataset: str
@@ -56,8 +62,10 @@ class JobResult:
     attempts: int = 1
     log_lines: list[str] = field(default_factory=list)
 
-    @property
+    @functools.cached_property
     def duration_seconds(self) -> Optional[float]:
+        # Cached: results are effectively immutable once built, and the
+        # notification formatters may read this several times per result.
         if self.finished_at and self.started_at:
             return (self.finished_at - self.started_at).total_seconds()
         return None
@@ -1,21 +1,58 @@
 """SSH connectivity and remote command execution."""
 
 import logging
+import select
 import socket
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import paramiko
 
 logger = logging.getLogger(__name__)
 
+# Cap on buffered output for run_command — long-running remote commands
+# (e.g. `zfs send` progress) can otherwise balloon memory.
+DEFAULT_MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+_TRUNCATION_MARKER = "\n[output truncated]\n"
+_READ_CHUNK_BYTES = 32768
+
+
+def _load_known_hosts() -> paramiko.HostKeys:
+    """Parse ~/.ssh/known_hosts once at import; empty store if absent."""
+    known_hosts = Path("~/.ssh/known_hosts").expanduser()
+    try:
+        return paramiko.HostKeys(filename=str(known_hosts))
+    except OSError:
+        return paramiko.HostKeys()
+
+
+_HOST_KEYS = _load_known_hosts()
+
+
+def _new_ssh_client() -> paramiko.SSHClient:
+    """
+    Build an SSHClient seeded with the shared known_hosts store.
+
+    Sharing one parsed HostKeys avoids re-reading known_hosts per call, and
+    WarningPolicy still connects to unknown hosts (required for freshly woken
+    backup boxes) while logging instead of silently trusting them.
+    """
+    client = paramiko.SSHClient()
+    # Deliberately private: get_host_keys().update() would copy entries into
+    # each client's own store instead of sharing the one parsed object.
+    client._host_keys = _HOST_KEYS  # type: ignore[attr-defined]
+    client.set_missing_host_key_policy(paramiko.WarningPolicy())
+    return client
+
 
 def wait_for_ssh(
     host: str,
     port: int = 22,
     timeout: int = 120,
     poll_interval: float = 5.0,
+    *,
+    sleep: Callable[[float], None] = time.sleep,
 ) -> bool:
     """
     Wait for SSH to become available on a remote host by polling TCP port 22.
@@ -25,6 +62,8 @@ def wait_for_ssh(
         port: SSH port (default: 22)
         timeout: Maximum seconds to wait (default: 120)
         poll_interval: Seconds between retries (default: 5)
+        sleep: Delay callable between retries — injectable so tests can
+            skip real waiting without patching the time module
 
     Returns:
         True if SSH is available within the timeout window, False otherwise
@@ -47,9 +86,9 @@ def wait_for_ssh(
                 attempt,
             )
             if remaining > poll_interval:
-                time.sleep(poll_interval)
+                sleep(poll_interval)
             else:
-                time.sleep(max(0, remaining))
+                sleep(max(0, remaining))
     logger.warning("SSH did not become available on %s:%d within %d s", host, port, timeout)
     return False
 
@@ -62,6 +101,7 @@ def run_command(
     key_path: Optional[str] = None,
     password: Optional[str] = None,
     connect_timeout: int = 30,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
 ) -> tuple[int, str, str]:
     """
     Execute a command on a remote host via SSH.
@@ -74,12 +114,13 @@ def run_command(
         key_path: Path to SSH private key (uses default key if None)
         password: SSH password (not recommended; prefer key auth)
         connect_timeout: Connection timeout in seconds (default: 30)
+        max_output_bytes: Truncate stdout/stderr beyond this many bytes
+            (default 8 MiB); use run_command_stream for unbounded output
 
     Returns:
         Tuple of (exit_code, stdout, stderr)
     """
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client = _new_ssh_client()
 
     connect_kwargs: dict = {
         "hostname": host,
@@ -99,10 +140,101 @@ def run_command(
         client.connect(**connect_kwargs)
         stdin, stdout, stderr = client.exec_command(command)
         exit_code = stdout.channel.recv_exit_status()
-        out = stdout.read().decode("utf-8", errors="replace")
-        err = stderr.read().decode("utf-8", errors="replace")
+        out = _read_capped(stdout, max_output_bytes)
+        err = _read_capped(stderr, max_output_bytes)
         if exit_code != 0:
             logger.warning("Remote command returned exit code %d: %s", exit_code, err.strip())
         return exit_code, out, err
     finally:
         client.close()
+
+
+def _read_capped(stream: paramiko.ChannelFile, max_bytes: int) -> str:
+    """Read a channel file in chunks, truncating past max_bytes with a marker.
+
+    Reading incrementally keeps peak memory near max_bytes: once the cap is
+    reached the rest of the stream is drained and discarded instead of being
+    buffered whole before slicing.
+    """
+    chunks: list[bytes] = []
+    received = 0
+    truncated = False
+    while chunk := stream.read(_READ_CHUNK_BYTES):
+        if received < max_bytes:
+            chunks.append(chunk)
+            received += len(chunk)
+        else:
+            truncated = True
+    data = b"".join(chunks)
+    if truncated or len(data) > max_bytes:
+        logger.warning("Remote command output exceeded %d bytes — truncating", max_bytes)
+        return data[:max_bytes].decode("utf-8", errors="replace") + _TRUNCATION_MARKER
+    return data.decode("utf-8", errors="replace")
+
+
+def run_command_stream(
+    host: str,
+    command: str,
+    user: str = "root",
+    port: int = 22,
+    key_path: Optional[str] = None,
+    password: Optional[str] = None,
+    connect_timeout: int = 30,
+    chunk_size: int = 32768,
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Execute a command on a remote host via SSH, streaming output incrementally.
+
+    Unlike run_command, output is yielded chunk-by-chunk as the remote command
+    produces it, so memory stays bounded and the caller can log progress for
+    long-running commands (e.g. `zfs send`).
+
+    Args:
+        host: Hostname or IP address
+        command: Command to execute
+        user: SSH user (default: root)
+        port: SSH port (default: 22)
+        key_path: Path to SSH private key (uses default key if None)
+        password: SSH password (not recommended; prefer key auth)
+        connect_timeout: Connection timeout in seconds (default: 30)
+        chunk_size: Maximum bytes read per channel recv call
+
+    Yields:
+        ("stdout", chunk) / ("stderr", chunk) tuples as output arrives
+    """
+    client = _new_ssh_client()
+
+    connect_kwargs: dict = {
+        "hostname": host,
+        "port": port,
+        "username": user,
+        "timeout": connect_timeout,
+        "allow_agent": True,
+        "look_for_keys": True,
+    }
+    if key_path:
+        connect_kwargs["key_filename"] = str(Path(key_path).expanduser())
+    if password:
+        connect_kwargs["password"] = password
+
+    logger.debug("SSH connect %s@%s:%d — streaming: %s", user, host, port, command)
+    try:
+        client.connect(**connect_kwargs)
+        stdin, stdout, stderr = client.exec_command(command)
+        channel = stdout.channel
+        while True:
+            select.select([channel], [], [], 1.0)
+            drained = True
+            if channel.recv_ready():
+                yield ("stdout", channel.recv(chunk_size))
+                drained = False
+            if channel.recv_stderr_ready():
+                yield ("stderr", channel.recv_stderr(chunk_size))
+                drained = False
+            if drained and channel.exit_status_ready():
+                break
+        exit_code = channel.recv_exit_status()
+        if exit_code != 0:
+            logger.warning("Remote command returned exit code %d", exit_code)
+    finally:
+        client.close()
@@ -1,8 +1,14 @@
 """Notification dispatchers for job results (ntfy.sh, Pushover, email)."""
 
+import copy
 import logging
+import queue
+import random
 import smtplib
-from email.mime.text import MIMEText
+import socket
+import threading
+import time
+from email.message import EmailMessage
 from typing import Any, Optional
 
 import httpx
@@ -11,15 +17,66 @@ from hozo.core.job import JobResult
 
 logger = logging.getLogger(__name__)
 
+# Shared timeout for the push-notification HTTP calls: a stuck read should not
+# consume the whole 10 s budget that a slow connect might need.
+_HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=7.0, write=3.0, pool=3.0)
+_HTTP_RETRIES = 3
+
+# Lazily-built shared client: HTTP keep-alive amortizes the TCP/TLS
+# handshake across notification bursts instead of reconnecting per POST.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=_HTTP_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                )
+    return _client
+
+
+def _post_with_retry(url: str, **kwargs: Any) -> httpx.Response:
+    """
+    POST with bounded retries and full-jitter backoff.
+
+    Retries transport errors and 5xx responses; 4xx responses are not retried.
+    Raises the last error if all attempts fail.
+    """
+    for attempt in range(_HTTP_RETRIES):
+        try:
+            resp = _get_client().post(url, **kwargs)
+            resp.raise_for_status()
+            return resp
+        except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+            retryable = not (
+                isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500
+            )
+            if attempt == _HTTP_RETRIES - 1 or not retryable:
+                raise
+            delay = random.uniform(0, min(4.0, 0.25 * 2**attempt))
+            logger.debug("POST %s failed (%s) — retrying in %.2fs", url, exc, delay)
+            time.sleep(delay)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+_NOTIFY_QUEUE: "queue.Queue[tuple[JobResult, dict[str, Any]]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
 
 def send_notification(result: JobResult, config: dict[str, Any]) -> None:
     """
-    Send a notification based on job result and config notification settings.
+    Queue a notification for the given job result.
 
-    Dispatches to all configured notification channels:
-      - ntfy.sh (if notifications.ntfy_topic is set)
-      - Pushover (if notifications.pushover_token + pushover_user are set)
-      - Email / SMTP (if notifications.smtp is configured)
+    Delivery happens on a daemon worker thread, so callers (the scheduler
+    loop, HTTP handlers) pay a constant-time enqueue instead of blocking
+    on network round-trips. Call :func:`flush` to wait for delivery —
+    one-shot callers like the CLI should do so before exiting.
 
     Args:
         result: The JobResult from a completed backup job
@@ -28,13 +85,129 @@ def send_notification(result: JobResult, config: dict[str, Any]) -> None:
     notif_config = config.get("settings", {}).get("notifications", {})
     if not notif_config:
         return
+    _ensure_worker()
+    _NOTIFY_QUEUE.put((result, config))
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Block until every queued notification has been dispatched.
+
+    Args:
+        timeout: Maximum seconds to wait; None waits indefinitely
+
+    Returns:
+        True if the queue drained, False on timeout
+    """
+    if timeout is None:
+        _NOTIFY_QUEUE.join()
+        return True
+    deadline = time.monotonic() + timeout
+    while _NOTIFY_QUEUE.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is None or not _worker.is_alive():
+        with _worker_lock:
+            if _worker is None or not _worker.is_alive():
+                _worker = threading.Thread(target=_drain, name="hozo-notify", daemon=True)
+                _worker.start()
+
+
+class NotificationBatcher:
+    """Coalesces bursts of queued results into one digest notification.
+
+    When several jobs finish in rapid succession each would otherwise cost
+    its own HTTP POST and SMTP exchange. The worker gathers everything that
+    arrives within a short window (bounded by size and time caps) and sends
+    a single consolidated message instead.
+    """
+
+    # How long to wait for the *next* result before closing the batch —
+    # bursts enqueue within milliseconds, so a short gap is enough.
+    _IDLE_GAP = 0.1
+
+    def __init__(self, max_batch_size: int = 10, max_queue_time: float = 2.0) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+
+    def collect(
+        self, q: "queue.Queue[tuple[JobResult, dict[str, Any]]]"
+    ) -> list[tuple[JobResult, dict[str, Any]]]:
+        """Block for the first queued item, then gather the rest of the
+        burst until the size cap, the time cap, or an idle gap."""
+        batch = [q.get()]
+        deadline = time.monotonic() + self.max_queue_time
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(q.get(timeout=min(self._IDLE_GAP, remaining)))
+            except queue.Empty:
+                break
+        return batch
+
+
+_batcher = NotificationBatcher()
+
+
+def _drain() -> None:
+    while True:
+        batch = _batcher.collect(_NOTIFY_QUEUE)
+        try:
+            if len(batch) == 1:
+                _dispatch(*batch[0])
+            else:
+                _dispatch_digest(batch)
+        except Exception as exc:  # a bad payload must never kill the worker
+            logger.error("Notification dispatch failed: %s", exc)
+        finally:
+            for _ in batch:
+                _NOTIFY_QUEUE.task_done()
+
+
+def _dispatch(result: JobResult, config: dict[str, Any]) -> None:
+    """
+    Deliver a notification synchronously to every configured channel:
+      - ntfy.sh (if notifications.ntfy_topic is set)
+      - Pushover (if notifications.pushover_token + pushover_user are set)
+      - Email / SMTP (if notifications.smtp is configured)
+    """
+    notif_config = config.get("settings", {}).get("notifications", {})
+    if not notif_config:
+        return
+    _deliver(
+        notif_config,
+        subject=_build_subject(result),
+        body=_build_body(result),
+        success=result.success,
+    )
+
+
+def _dispatch_digest(batch: list[tuple[JobResult, dict[str, Any]]]) -> None:
+    """Deliver one consolidated notification for a burst of results."""
+    results = [result for result, _ in batch]
+    notif_config = batch[-1][1].get("settings", {}).get("notifications", {})
+    if not notif_config:
+        return
+    _deliver(
+        notif_config,
+        subject=_build_digest_subject(results),
+        body=_build_digest_body(results),
+        success=all(r.success for r in results),
+    )
 
-    subject = _build_subject(result)
-    body = _build_body(result)
 
+def _deliver(notif_config: dict[str, Any], subject: str, body: str, success: bool) -> None:
     ntfy_topic = notif_config.get("ntfy_topic")
     if ntfy_topic:
-        _send_ntfy(topic=ntfy_topic, title=subject, message=body, success=result.success)
+        _send_ntfy(topic=ntfy_topic, title=subject, message=body, success=success)
 
     pushover_token = notif_config.get("pushover_token")
     pushover_user = notif_config.get("pushover_user")
@@ -49,6 +222,22 @@ def send_notification(result: JobResult, config: dict[str, Any]) -> None:
 # ── Formatters ────────────────────────────────────────────────────────────────
 
 
+def _build_digest_subject(results: list[JobResult]) -> str:
+    failed = sum(1 for r in results if not r.success)
+    if failed:
+        return f"Hōzō ❌ {failed}/{len(results)} jobs failed"
+    return f"Hōzō ✅ {len(results)} jobs succeeded"
+
+
+def _build_digest_body(results: list[JobResult]) -> str:
+    lines = []
+    for r in results:
+        status = "ok" if r.success else f"FAILED ({r.error})"
+        duration = f" in {r.duration_seconds:.1f}s" if r.duration_seconds is not None else ""
+        lines.append(f"{r.job_name}: {status}{duration}")
+    return "\n".join(lines)
+
+
 def _build_subject(result: JobResult) -> str:
     status = "✅ SUCCESS" if result.success else "❌ FAILED"
     return f"Hōzō {status}: {result.job_name}"
@@ -88,7 +277,7 @@ def _send_ntfy(
     priority = "default" if success else "high"
     tags = "white_check_mark" if success else "warning"
     try:
-        resp = httpx.post(
+        _post_with_retry(
             url,
             content=message.encode("utf-8"),
             headers={
@@ -96,9 +285,7 @@ def _send_ntfy(
                 "Priority": priority,
                 "Tags": tags,
             },
-            timeout=10,
         )
-        resp.raise_for_status()
         logger.info("ntfy notification sent to topic '%s'", topic)
     except Exception as exc:
         logger.error("Failed to send ntfy notification: %s", exc)
@@ -109,12 +296,10 @@ def _send_ntfy(
 
 def _send_pushover(token: str, user: str, title: str, message: str) -> None:
     try:
-        resp = httpx.post(
+        _post_with_retry(
             "https://api.pushover.net/1/messages.json",
             data={"token": token, "user": user, "title": title, "message": message},
-            timeout=10,
         )
-        resp.raise_for_status()
         logger.info("Pushover notification sent")
     except Exception as exc:
         logger.error("Failed to send Pushover notification: %s", exc)
@@ -123,36 +308,123 @@ def _send_pushover(token: str, user: str, title: str, message: str) -> None:
 # ── Email / SMTP ──────────────────────────────────────────────────────────────
 
 
+# Base messages with From/To already parsed, keyed by (from_addr, to_addr).
+# Header address parsing is the bulk of building one of these small
+# messages, and the pair never changes between sends.
+_EMAIL_TEMPLATE_CACHE: dict[tuple[str, str], EmailMessage] = {}
+
+
+def _base_message(from_addr: str, to_addr: str) -> EmailMessage:
+    template = _EMAIL_TEMPLATE_CACHE.get((from_addr, to_addr))
+    if template is None:
+        template = EmailMessage()
+        template["From"] = from_addr
+        template["To"] = to_addr
+        _EMAIL_TEMPLATE_CACHE[(from_addr, to_addr)] = template
+    # deepcopy stays on the public API (copy.copy would share the header
+    # list) and still skips re-parsing the From/To addresses.
+    return copy.deepcopy(template)
+
+
 def _send_email(smtp_cfg: dict[str, Any], subject: str, body: str) -> None:
     """
-    smtp_cfg keys: host, port, user, password, from_addr, to_addr, use_tls
+    smtp_cfg keys: host, port, user, password, from_addr, to_addr, use_tls, timeout
     """
-    host: str = smtp_cfg.get("host", "localhost")
-    port: int = int(smtp_cfg.get("port", 587))
     user: Optional[str] = smtp_cfg.get("user")
-    password: Optional[str] = smtp_cfg.get("password")
     from_addr: str = smtp_cfg.get("from_addr", user or "hozo@localhost")
     to_addr: str = smtp_cfg.get("to_addr", "")
-    use_tls: bool = bool(smtp_cfg.get("use_tls", True))
 
     if not to_addr:
         logger.warning("SMTP configured but no 'to_addr' specified — skipping email")
         return
 
-    msg = MIMEText(body, "plain", "utf-8")
+    msg = _base_message(from_addr, to_addr)
     msg["Subject"] = subject
-    msg["From"] = from_addr
-    msg["To"] = to_addr
+    msg.set_content(body)
 
     try:
-        with smtplib.SMTP(host, port, timeout=15) as smtp:
-            if use_tls:
-                smtp.ehlo()
-                smtp.starttls()
-                smtp.ehlo()
-            if user and password:
-                smtp.login(user, password)
-            smtp.sendmail(from_addr, [to_addr], msg.as_string())
+        _smtp_pool.send(smtp_cfg, msg)
         logger.info("Email notification sent to %s", to_addr)
     except Exception as exc:
         logger.error("Failed to send email notification: %s", exc)
+
+
+class _SMTPPool:
+    """Keeps authenticated SMTP connections open between notifications.
+
+    Connection setup (TCP handshake, EHLO, STARTTLS, AUTH) dominates the
+    cost of sending one small message, and the scheduler can fire several
+    job results in a burst. Connections are keyed by (host, port, user);
+    entries idle longer than _IDLE_TTL are closed on next use, and a
+    server-side disconnect triggers one transparent reconnect.
+    """
+
+    _IDLE_TTL = 100.0  # seconds
+
+    def __init__(self) -> None:
+        self._conns: dict[tuple[str, int, Optional[str]], tuple[smtplib.SMTP, float]] = {}
+        self._lock = threading.Lock()
+
+    def send(self, smtp_cfg: dict[str, Any], msg: EmailMessage) -> None:
+        key = (
+            smtp_cfg.get("host", "localhost"),
+            int(smtp_cfg.get("port", 587)),
+            smtp_cfg.get("user"),
+        )
+        with self._lock:
+            smtp = self._checkout(key, smtp_cfg)
+            try:
+                # send_message serializes the EmailMessage directly instead
+                # of the as_string() round-trip that sendmail would re-parse.
+                smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._close(smtp)
+                smtp = self._connect(smtp_cfg)
+                smtp.send_message(msg)
+            self._conns[key] = (smtp, time.monotonic())
+
+    def clear(self) -> None:
+        """Close and drop every pooled connection."""
+        with self._lock:
+            for smtp, _ in self._conns.values():
+                self._close(smtp)
+            self._conns.clear()
+
+    def _checkout(
+        self, key: tuple[str, int, Optional[str]], smtp_cfg: dict[str, Any]
+    ) -> smtplib.SMTP:
+        entry = self._conns.pop(key, None)
+        if entry is not None:
+            smtp, last_used = entry
+            if time.monotonic() - last_used < self._IDLE_TTL:
+                return smtp
+            self._close(smtp)
+        return self._connect(smtp_cfg)
+
+    @staticmethod
+    def _connect(smtp_cfg: dict[str, Any]) -> smtplib.SMTP:
+        host = smtp_cfg.get("host", "localhost")
+        port = int(smtp_cfg.get("port", 587))
+        # Fast-fail on unresolvable hosts: a typo'd hostname should cost a
+        # DNS error, not a full connect-timeout wait on the worker thread.
+        socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+        smtp = smtplib.SMTP(host, port, timeout=int(smtp_cfg.get("timeout", 30)))
+        if bool(smtp_cfg.get("use_tls", True)):
+            smtp.ehlo()
+            smtp.starttls()
+            smtp.ehlo()
+        user = smtp_cfg.get("user")
+        password = smtp_cfg.get("password")
+        if user and password:
+            smtp.login(user, password)
+        return smtp
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:  # already gone — nothing left to clean up
+            pass
+
+
+_smtp_pool = _SMTPPool()
@@ -1,15 +1,21 @@
 """APScheduler-based job scheduler for Hōzō."""
 
+import functools
 import logging
+import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+# APScheduler is the slowest import in the package; defer it to first use
+# so `hozo --help` and modules that never schedule don't pay for it.
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger
 
 from hozo.config.loader import jobs_from_config, load_config
 from hozo.core.job import BackupJob, JobResult, run_job
+from hozo.notifications.notify import flush as flush_notifications
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +36,14 @@ _DOW_MAP = {
 }
 
 
-def parse_schedule(schedule_str: str) -> CronTrigger:
+@functools.lru_cache(maxsize=256)
+def parse_schedule(schedule_str: str) -> "CronTrigger":
     """
     Parse a human-readable schedule string into an APScheduler CronTrigger.
 
+    Results are memoized — CronTrigger is immutable once constructed, so
+    identical schedule strings share one instance.
+
     Supported formats:
         "daily HH:MM"          — runs every day at HH:MM
         "weekly <Day> HH:MM"   — runs once a week on <Day> at HH:MM
@@ -47,6 +57,8 @@ def parse_schedule(schedule_str: str) -> CronTrigger:
     Raises:
         ValueError: If the schedule string is not recognized
     """
+    from apscheduler.triggers.cron import CronTrigger
+
     weekly = _WEEKLY_RE.match(schedule_str.strip())
     if weekly:
         day_name, hh, mm = weekly.group(1), weekly.group(2), weekly.group(3)
@@ -82,9 +94,25 @@ class HozoScheduler:
         Args:
             on_result: Optional callback invoked after each job completes with its JobResult.
         """
-        self._scheduler = BackgroundScheduler(timezone="UTC")
+        from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        # APScheduler defaults to 20 worker threads; a handful of I/O-bound
+        # backup jobs doesn't need that, and coalescing collapses missed
+        # fires instead of replaying a backlog after a stall.
+        self._scheduler = BackgroundScheduler(
+            timezone="UTC",
+            executors={
+                "default": APSThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 2))
+            },
+            job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 30},
+        )
         self._jobs: list[BackupJob] = []
+        self._jobs_by_name: dict[str, BackupJob] = {}
         self._on_result = on_result
+        # Worker pool for on-demand job submissions (submit_job). Backups run
+        # for minutes to hours, so callers must not block an HTTP handler.
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hozo-job")
 
     def load_jobs_from_config(self, config_path: Path) -> int:
         """
@@ -103,30 +131,43 @@ class HozoScheduler:
 
         raw_jobs = config.get("jobs", [])
         self._jobs = jobs_from_config(config)
+        self._jobs_by_name = {job.name: job for job in self._jobs}
+        # Precompute the schedule lookup so registration does not depend on
+        # self._jobs and raw_jobs having the same ordering.
+        schedule_by_name = {raw["name"]: raw.get("schedule", "") for raw in raw_jobs}
 
         registered = 0
-        for job, raw in zip(self._jobs, raw_jobs):
-            schedule_str = raw.get("schedule", "")
-            if not schedule_str:
-                logger.info("Job '%s' has no schedule — skipping auto-scheduling", job.name)
-                continue
-            try:
-                trigger = parse_schedule(schedule_str)
-            except ValueError as exc:
-                logger.error("Could not parse schedule for job '%s': %s", job.name, exc)
-                continue
-
-            self._scheduler.add_job(
-                func=self._run_job_wrapper,
-                trigger=trigger,
-                args=[job],
-                id=job.name,
-                name=job.name,
-                replace_existing=True,
-                misfire_grace_time=300,
-            )
-            logger.info("Scheduled job '%s' with trigger: %s", job.name, schedule_str)
-            registered += 1
+        # Pause job processing during bulk registration so the scheduler
+        # wakeup doesn't fire between individual add_job calls.
+        was_running = self._scheduler.running
+        if was_running:
+            self._scheduler.pause()
+        try:
+            for job in self._jobs:
+                schedule_str = schedule_by_name.get(job.name, "")
+                if not schedule_str:
+                    logger.info("Job '%s' has no schedule — skipping auto-scheduling", job.name)
+                    continue
+                try:
+                    trigger = parse_schedule(schedule_str)
+                except ValueError as exc:
+                    logger.error("Could not parse schedule for job '%s': %s", job.name, exc)
+                    continue
+
+                self._scheduler.add_job(
+                    func=self._run_job_wrapper,
+                    trigger=trigger,
+                    args=[job],
+                    id=job.name,
+                    name=job.name,
+                    replace_existing=True,
+                    misfire_grace_time=300,
+                )
+                logger.info("Scheduled job '%s' with trigger: %s", job.name, schedule_str)
+                registered += 1
+        finally:
+            if was_running:
+                self._scheduler.resume()
 
         return registered
 
@@ -150,6 +191,7 @@ class HozoScheduler:
         jid = job_id or job.name
         if job not in self._jobs:
             self._jobs.append(job)
+        self._jobs_by_name[job.name] = job
         self._scheduler.add_job(
             func=self._run_job_wrapper,
             trigger=trigger,
@@ -181,22 +223,51 @@ class HozoScheduler:
         Returns:
             JobResult, or None if job_name not found
         """
-        for job in self._jobs:
-            if job.name == job_name:
-                return run_job(job)
-        logger.error("Job '%s' not found", job_name)
-        return None
+        job = self._jobs_by_name.get(job_name)
+        if job is None:
+            logger.error("Job '%s' not found", job_name)
+            return None
+        return run_job(job)
+
+    def submit_job(self, job_name: str) -> Optional["Future[None]"]:
+        """
+        Execute a job by name on a background worker thread (non-blocking).
+
+        The job runs through the same wrapper as scheduled executions, so the
+        ``on_result`` callback fires when it completes.
+
+        Args:
+            job_name: Name of the job as defined in config
+
+        Returns:
+            Future for the running job, or None if job_name not found
+        """
+        job = self._jobs_by_name.get(job_name)
+        if job is None:
+            logger.error("Job '%s' not found", job_name)
+            return None
+        return self._executor.submit(self._run_job_wrapper, job)
 
     @property
     def jobs(self) -> list[BackupJob]:
         return list(self._jobs)
 
+    def remove_all_jobs(self) -> None:
+        """Unregister every job without stopping the scheduler."""
+        self._scheduler.remove_all_jobs()
+        self._jobs.clear()
+        self._jobs_by_name.clear()
+
     def start(self) -> None:
         """Start the background scheduler."""
         self._scheduler.start()
         logger.info("Scheduler started with %d job(s)", len(self._scheduler.get_jobs()))
 
     def stop(self, wait: bool = True) -> None:
-        """Stop the background scheduler."""
+        """Stop the background scheduler and the on-demand worker pool."""
         self._scheduler.shutdown(wait=wait)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if wait:
+            # Let queued notifications from just-finished jobs go out.
+            flush_notifications(timeout=10.0)
         logger.info("Scheduler stopped")
@@ -0,0 +1,129 @@
+"""Shared fixtures for the test suite.
+
+The session-scoped app clients live here (rather than in test_api.py) so
+pytest-xdist workers resolve them once per worker process — each worker
+builds its own app and tmp config root, so parallel runs don't contend on
+shared files.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+# Warm the core modules once per process: under pytest-xdist each worker
+# resolves the heavy import chains (paramiko, PyYAML) here before test
+# collection instead of mid-run inside the first test module that needs them.
+import hozo.config.loader  # noqa: F401
+import hozo.config.writer  # noqa: F401
+import hozo.core.job  # noqa: F401
+import hozo.core.ssh  # noqa: F401
+import hozo.core.wol  # noqa: F401
+from hozo.api.routes import create_app
+from hozo.auth.webauthn_helpers import StoredCredential
+
+# The credential registered on the shared authed_client app. Built (and
+# serialized) once — fixtures hand out deep copies where mutation matters.
+_HW_CRED = StoredCredential(
+    credential_id=b"\xAA\xBB",
+    public_key=b"\x01\x02",
+    sign_count=0,
+    device_name="HW Key",
+)
+_HW_CRED_DICT = _HW_CRED.to_dict()
+
+_CONFIG = {
+    "jobs": [
+        {
+            "name": "weekly",
+            "source": "rpool/data",
+            "target_host": "backup.local",
+            "target_dataset": "backup/data",
+            "mac_address": "AA:BB:CC:DD:EE:FF",
+            "schedule": "weekly Sunday 03:00",
+        }
+    ]
+}
+
+# Serialized once — the dict is constant, so there's no reason to pay a
+# pure-Python yaml.dump per fixture invocation / state reset.
+_CONFIG_YAML = yaml.safe_dump(_CONFIG)
+
+# App-state keys the shared client snapshots and restores between tests.
+# "scheduler" is restored by reference (it holds thread locks).
+_STATE_KEYS = (
+    "raw_config",
+    "settings",
+    "auth",
+    "jobs",
+    "last_results",
+    "last_restore_results",
+    "pending_challenges",
+)
+
+
+def _write_config(tmp_path: Path) -> Path:
+    p = tmp_path / "config.yaml"
+    p.write_text(_CONFIG_YAML)
+    return p
+
+
+def _build_client(tmp_path: Path, credentials: list | None = None) -> TestClient:
+    """Build an app + TestClient around a fresh config, with a state snapshot."""
+    config_path = _write_config(tmp_path)
+    app = create_app(config_path=str(config_path))
+    if credentials is not None:
+        app.state.auth["credentials"] = credentials
+    # Redirect-following is opt-in: most tests only assert the 303, and
+    # following would re-render the target page on every POST.
+    tc = TestClient(app, follow_redirects=False)
+    tc._hozo_config_path = config_path
+    tc._hozo_scheduler = app.state.scheduler
+    tc._hozo_snapshot = {k: copy.deepcopy(getattr(app.state, k)) for k in _STATE_KEYS}
+    return tc
+
+
+def _restore_client(tc: TestClient) -> None:
+    """Restore a shared client's app state, cookie jar, and config file."""
+    state = tc.app.state
+    state.scheduler = tc._hozo_scheduler
+    for key in _STATE_KEYS:
+        setattr(state, key, copy.deepcopy(tc._hozo_snapshot[key]))
+    tc.cookies.clear()
+    tc._hozo_config_path.write_text(_CONFIG_YAML)
+
+
+@pytest.fixture(scope="session")
+def shared_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One config file for tests that build an app but never write back."""
+    return _write_config(tmp_path_factory.mktemp("shared_cfg"))
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Shared app + TestClient, built once per session (per xdist worker).
+
+    The per-test state reset lives in test_api.py's _reset_app_state;
+    building the app (config parse, TestClient transport, scheduler
+    patches) ~50 times was pure overhead.
+    """
+    yield _build_client(tmp_path_factory.mktemp("cfg"))
+
+
+@pytest.fixture(scope="session")
+def authed_client(tmp_path_factory: pytest.TempPathFactory):
+    """Shared client whose app has one WebAuthn credential registered."""
+    yield _build_client(
+        tmp_path_factory.mktemp("authed_cfg"), credentials=[copy.deepcopy(_HW_CRED_DICT)]
+    )
+
+
+@pytest.fixture(scope="session")
+def bootstrap_client(tmp_path_factory: pytest.TempPathFactory):
+    """Shared client whose app was created with a nonexistent config path."""
+    missing_path = tmp_path_factory.mktemp("bootstrap") / "nonexistent.yaml"
+    app = create_app(config_path=str(missing_path))
+    yield TestClient(app)
@@ -1,12 +1,15 @@
 """Tests for auth session and WebAuthn helpers."""
 
+import base64
 import time
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
 from hozo.auth.session import generate_secret, make_session_cookie, verify_session_cookie
 from hozo.auth.webauthn_helpers import (
+    CHALLENGE_TTL,
     StoredCredential,
     _b64url_decode,
     begin_authentication,
@@ -24,35 +27,39 @@ class TestGenerateSecret:
     def test_returns_64_char_hex(self) -> None:
         s = generate_secret()
         assert len(s) == 64
-        assert all(c in "0123456789abcdef" for c in s)
+        bytes.fromhex(s)  # raises ValueError if any char isn't hex
 
     def test_each_call_unique(self) -> None:
         assert generate_secret() != generate_secret()
 
 
 class TestSessionCookie:
-    def test_roundtrip(self) -> None:
-        secret = generate_secret()
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def secret() -> str:
+        # One entropy read for the class — none of these tests need a
+        # fresh secret (uniqueness is covered by TestGenerateSecret).
+        return generate_secret()
+
+    def test_roundtrip(self, secret: str) -> None:
         cookie = make_session_cookie(secret)
         assert verify_session_cookie(cookie, secret)
 
-    def test_wrong_secret_fails(self) -> None:
-        cookie = make_session_cookie(generate_secret())
+    def test_wrong_secret_fails(self, secret: str) -> None:
+        cookie = make_session_cookie(secret)
         assert not verify_session_cookie(cookie, generate_secret())
 
-    def test_tampered_cookie_fails(self) -> None:
-        secret = generate_secret()
+    def test_tampered_cookie_fails(self, secret: str) -> None:
         cookie = make_session_cookie(secret)
         assert not verify_session_cookie(cookie + "x", secret)
 
-    def test_expired_cookie_fails(self) -> None:
-        secret = generate_secret()
+    def test_expired_cookie_fails(self, secret: str) -> None:
         cookie = make_session_cookie(secret)
         # max_age=-1 → always expired (0 fails due to 1-second timestamp granularity)
         assert not verify_session_cookie(cookie, secret, max_age=-1)
 
-    def test_empty_cookie_fails(self) -> None:
-        assert not verify_session_cookie("", generate_secret())
+    def test_empty_cookie_fails(self, secret: str) -> None:
+        assert not verify_session_cookie("", secret)
 
 
 # ── WebAuthn helpers tests ────────────────────────────────────────────────────
@@ -68,28 +75,27 @@ class TestB64UrlDecode:
 
 
 class TestStoredCredential:
-    def _make_cred(self) -> StoredCredential:
-        return StoredCredential(
-            credential_id=b"\x01\x02\x03\x04",
-            public_key=b"\x05\x06\x07\x08",
-            sign_count=42,
-            device_name="Test Device",
-        )
+    # Built once at import; nothing here mutates it.
+    CRED = StoredCredential(
+        credential_id=b"\x01\x02\x03\x04",
+        public_key=b"\x05\x06\x07\x08",
+        sign_count=42,
+        device_name="Test Device",
+    )
 
     def test_to_dict_contains_expected_keys(self) -> None:
-        d = self._make_cred().to_dict()
+        d = self.CRED.to_dict()
         assert set(d.keys()) == {"id", "public_key", "sign_count", "device_name", "added_at"}
 
     def test_roundtrip(self) -> None:
-        cred = self._make_cred()
-        restored = StoredCredential.from_dict(cred.to_dict())
-        assert restored.credential_id == cred.credential_id
-        assert restored.public_key == cred.public_key
-        assert restored.sign_count == cred.sign_count
-        assert restored.device_name == cred.device_name
+        restored = StoredCredential.from_dict(self.CRED.to_dict())
+        assert restored.credential_id == self.CRED.credential_id
+        assert restored.public_key == self.CRED.public_key
+        assert restored.sign_count == self.CRED.sign_count
+        assert restored.device_name == self.CRED.device_name
 
     def test_id_is_base64url_no_padding(self) -> None:
-        d = self._make_cred().to_dict()
+        d = self.CRED.to_dict()
         assert "=" not in d["id"]
 
 
@@ -116,25 +122,21 @@ class TestChallengeStore:
         with pytest.raises(ValueError):
             pop_challenge(pending, challenge)
 
-    def test_expired_challenge_pruned(self) -> None:
+    @pytest.mark.parametrize("offset", [1, 1000])
+    def test_expired_challenge_pruned(self, offset: int) -> None:
         pending: dict = {}
         challenge = b"\x03\x04"
         store_challenge(pending, challenge)
-        # Force expiry by setting timestamp to the past
-        key = list(pending.keys())[0]
-        pending[key] = (pending[key][0], time.monotonic() - 1)
+        # A clock reading from past the TTL, instead of rewriting stored tuples
+        after_ttl = time.monotonic() + CHALLENGE_TTL + offset
+
+        # Popping an expired challenge raises...
         with pytest.raises(ValueError, match="expired"):
-            pop_challenge(pending, challenge)
+            pop_challenge(pending, challenge, _now=lambda: after_ttl)
 
-    def test_old_challenges_pruned_on_new_store(self) -> None:
-        pending: dict = {}
-        old_challenge = b"\x11"
-        store_challenge(pending, old_challenge)
-        key = list(pending.keys())[0]
-        pending[key] = (pending[key][0], time.monotonic() - 1000)  # very old
-        new_challenge = b"\x22"
-        store_challenge(pending, new_challenge)
-        # Old challenge should be pruned
+        # ...and storing a new one prunes any stale leftovers
+        store_challenge(pending, challenge)
+        store_challenge(pending, b"\x22", _now=lambda: after_ttl)
         assert len(pending) == 1
 
 
@@ -142,50 +144,64 @@ class TestChallengeStore:
 
 
 class TestBeginRegistration:
-    @patch("hozo.auth.webauthn_helpers.webauthn.generate_registration_options")
-    @patch("hozo.auth.webauthn_helpers.webauthn.options_to_json")
-    def test_returns_json_and_challenge(self, mock_to_json: MagicMock, mock_gen: MagicMock) -> None:
+    @pytest.fixture(autouse=True)
+    def mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        # One monkeypatch per test instead of a @patch decorator stack —
+        # no _patch importlib machinery rebuilt for every method.
+        m = SimpleNamespace(gen=MagicMock(), to_json=MagicMock())
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.webauthn.generate_registration_options", m.gen
+        )
+        monkeypatch.setattr("hozo.auth.webauthn_helpers.webauthn.options_to_json", m.to_json)
+        return m
+
+    def test_returns_json_and_challenge(self, mocks: SimpleNamespace) -> None:
         mock_options = MagicMock()
         mock_options.challenge = b"\xab\xcd"
-        mock_gen.return_value = mock_options
-        mock_to_json.return_value = '{"publicKey": "test"}'
+        mocks.gen.return_value = mock_options
+        mocks.to_json.return_value = '{"publicKey": "test"}'
 
         result_json, challenge = begin_registration("localhost", "Hōzō")
 
         assert result_json == '{"publicKey": "test"}'
         assert challenge == b"\xab\xcd"
-        mock_gen.assert_called_once()
-        mock_to_json.assert_called_once_with(mock_options)
+        mocks.gen.assert_called_once()
+        mocks.to_json.assert_called_once_with(mock_options)
 
-    @patch("hozo.auth.webauthn_helpers.webauthn.generate_registration_options")
-    @patch("hozo.auth.webauthn_helpers.webauthn.options_to_json")
-    def test_uses_rp_id_and_name(self, mock_to_json: MagicMock, mock_gen: MagicMock) -> None:
+    def test_uses_rp_id_and_name(self, mocks: SimpleNamespace) -> None:
         mock_options = MagicMock()
         mock_options.challenge = b"\x01"
-        mock_gen.return_value = mock_options
-        mock_to_json.return_value = "{}"
+        mocks.gen.return_value = mock_options
+        mocks.to_json.return_value = "{}"
 
         begin_registration("my.host.net", "MyApp")
 
-        call_kwargs = mock_gen.call_args
+        call_kwargs = mocks.gen.call_args
         assert call_kwargs.kwargs["rp_id"] == "my.host.net"
         assert call_kwargs.kwargs["rp_name"] == "MyApp"
 
 
 class TestCompleteRegistration:
-    @patch("hozo.auth.webauthn_helpers.webauthn.verify_registration_response")
-    @patch("hozo.auth.webauthn_helpers.parse_registration_credential_json")
-    def test_returns_stored_credential(
-        self, mock_parse: MagicMock, mock_verify: MagicMock
-    ) -> None:
+    @pytest.fixture(autouse=True)
+    def mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        m = SimpleNamespace(parse=MagicMock(), verify=MagicMock())
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.parse_registration_credential_json", m.parse
+        )
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.webauthn.verify_registration_response", m.verify
+        )
+        return m
+
+    def test_returns_stored_credential(self, mocks: SimpleNamespace) -> None:
         mock_credential = MagicMock()
-        mock_parse.return_value = mock_credential
+        mocks.parse.return_value = mock_credential
 
         mock_verification = MagicMock()
         mock_verification.credential_id = b"\x10\x20\x30"
         mock_verification.credential_public_key = b"\x40\x50\x60"
         mock_verification.sign_count = 0
-        mock_verify.return_value = mock_verification
+        mocks.verify.return_value = mock_verification
 
         result = complete_registration(
             body='{"id":"abc"}',
@@ -201,13 +217,9 @@ class TestCompleteRegistration:
         assert result.sign_count == 0
         assert result.device_name == "Security Key"
 
-    @patch("hozo.auth.webauthn_helpers.webauthn.verify_registration_response")
-    @patch("hozo.auth.webauthn_helpers.parse_registration_credential_json")
-    def test_raises_on_verification_failure(
-        self, mock_parse: MagicMock, mock_verify: MagicMock
-    ) -> None:
-        mock_parse.return_value = MagicMock()
-        mock_verify.side_effect = Exception("Invalid CBOR")
+    def test_raises_on_verification_failure(self, mocks: SimpleNamespace) -> None:
+        mocks.parse.return_value = MagicMock()
+        mocks.verify.side_effect = Exception("Invalid CBOR")
 
         with pytest.raises(Exception, match="Invalid CBOR"):
             complete_registration(
@@ -219,13 +231,20 @@ class TestCompleteRegistration:
 
 
 class TestBeginAuthentication:
-    @patch("hozo.auth.webauthn_helpers.webauthn.generate_authentication_options")
-    @patch("hozo.auth.webauthn_helpers.webauthn.options_to_json")
-    def test_returns_json_and_challenge(self, mock_to_json: MagicMock, mock_gen: MagicMock) -> None:
+    @pytest.fixture(autouse=True)
+    def mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        m = SimpleNamespace(gen=MagicMock(), to_json=MagicMock())
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.webauthn.generate_authentication_options", m.gen
+        )
+        monkeypatch.setattr("hozo.auth.webauthn_helpers.webauthn.options_to_json", m.to_json)
+        return m
+
+    def test_returns_json_and_challenge(self, mocks: SimpleNamespace) -> None:
         mock_options = MagicMock()
         mock_options.challenge = b"\xde\xad"
-        mock_gen.return_value = mock_options
-        mock_to_json.return_value = '{"allowCredentials": []}'
+        mocks.gen.return_value = mock_options
+        mocks.to_json.return_value = '{"allowCredentials": []}'
 
         cred = StoredCredential(
             credential_id=b"\x01\x02",
@@ -237,46 +256,53 @@ class TestBeginAuthentication:
 
         assert result_json == '{"allowCredentials": []}'
         assert challenge == b"\xde\xad"
-        mock_gen.assert_called_once()
+        mocks.gen.assert_called_once()
 
-    @patch("hozo.auth.webauthn_helpers.webauthn.generate_authentication_options")
-    @patch("hozo.auth.webauthn_helpers.webauthn.options_to_json")
-    def test_no_credentials_still_works(self, mock_to_json: MagicMock, mock_gen: MagicMock) -> None:
+    def test_no_credentials_still_works(self, mocks: SimpleNamespace) -> None:
         mock_options = MagicMock()
         mock_options.challenge = b"\x01"
-        mock_gen.return_value = mock_options
-        mock_to_json.return_value = "{}"
+        mocks.gen.return_value = mock_options
+        mocks.to_json.return_value = "{}"
 
         begin_authentication("localhost", [])
-        mock_gen.assert_called_once()
+        mocks.gen.assert_called_once()
 
 
 class TestCompleteAuthentication:
+    # The stored credential id and its browser-side base64url form,
+    # computed once at import rather than per test.
+    CRED_ID = b"\xAA\xBB\xCC\xDD"
+    CRED_ID_B64 = base64.urlsafe_b64encode(CRED_ID).decode().rstrip("=")
+
     def _make_stored_cred(self) -> StoredCredential:
         return StoredCredential(
-            credential_id=b"\xAA\xBB\xCC\xDD",
+            credential_id=self.CRED_ID,
             public_key=b"\x01\x02\x03\x04",
             sign_count=5,
             device_name="Test Key",
         )
 
-    @patch("hozo.auth.webauthn_helpers.webauthn.verify_authentication_response")
-    @patch("hozo.auth.webauthn_helpers.parse_authentication_credential_json")
-    def test_returns_updated_credential(
-        self, mock_parse: MagicMock, mock_verify: MagicMock
-    ) -> None:
-        import base64
+    @pytest.fixture(autouse=True)
+    def mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        m = SimpleNamespace(parse=MagicMock(), verify=MagicMock())
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.parse_authentication_credential_json", m.parse
+        )
+        monkeypatch.setattr(
+            "hozo.auth.webauthn_helpers.webauthn.verify_authentication_response", m.verify
+        )
+        return m
 
+    def test_returns_updated_credential(self, mocks: SimpleNamespace) -> None:
         stored_cred = self._make_stored_cred()
-        cred_id_b64 = base64.urlsafe_b64encode(stored_cred.credential_id).decode().rstrip("=")
 
         mock_credential = MagicMock()
-        mock_credential.id = cred_id_b64
-        mock_parse.return_value = mock_credential
+        mock_credential.id = self.CRED_ID_B64
+        mocks.parse.return_value = mock_credential
 
         mock_verification = MagicMock()
         mock_verification.new_sign_count = 6
-        mock_verify.return_value = mock_verification
+        mocks.verify.return_value = mock_verification
 
         result = complete_authentication(
             body='{"id":"test"}',
@@ -289,14 +315,11 @@ class TestCompleteAuthentication:
         assert result.sign_count == 6
         assert result.credential_id == stored_cred.credential_id
 
-    @patch("hozo.auth.webauthn_helpers.parse_authentication_credential_json")
-    def test_raises_if_no_matching_credential(self, mock_parse: MagicMock) -> None:
-        import base64
-
+    def test_raises_if_no_matching_credential(self, mocks: SimpleNamespace) -> None:
         # credential id that doesn't match any stored cred
         mock_credential = MagicMock()
         mock_credential.id = base64.urlsafe_b64encode(b"\xFF\xFF\xFF\xFF").decode().rstrip("=")
-        mock_parse.return_value = mock_credential
+        mocks.parse.return_value = mock_credential
 
         stored_cred = self._make_stored_cred()
 
@@ -309,20 +332,13 @@ class TestCompleteAuthentication:
                 stored_credentials=[stored_cred],
             )
 
-    @patch("hozo.auth.webauthn_helpers.webauthn.verify_authentication_response")
-    @patch("hozo.auth.webauthn_helpers.parse_authentication_credential_json")
-    def test_raises_on_verification_failure(
-        self, mock_parse: MagicMock, mock_verify: MagicMock
-    ) -> None:
-        import base64
-
+    def test_raises_on_verification_failure(self, mocks: SimpleNamespace) -> None:
         stored_cred = self._make_stored_cred()
-        cred_id_b64 = base64.urlsafe_b64encode(stored_cred.credential_id).decode().rstrip("=")
 
         mock_credential = MagicMock()
-        mock_credential.id = cred_id_b64
-        mock_parse.return_value = mock_credential
-        mock_verify.side_effect = Exception("Signature mismatch")
+        mock_credential.id = self.CRED_ID_B64
+        mocks.parse.return_value = mock_credential
+        mocks.verify.side_effect = Exception("Signature mismatch")
 
         with pytest.raises(Exception, match="Signature mismatch"):
             complete_authentication(
@@ -1,38 +1,148 @@
 """Tests for the Hōzō CLI."""
 
+import functools
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
 from hozo.cli import main
+from hozo.config.loader import jobs_from_config
 from hozo.core.job import JobResult
 
+# CliRunner is stateless across .invoke calls (each invoke builds its own
+# isolation context), so one shared instance serves the whole module.
+_RUNNER = CliRunner()
+
+# libyaml-backed dumper when available — these helpers serialize a config
+# for nearly every test in this module
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+_DEFAULT_JOB: dict = {
+    "name": "weekly",
+    "source": "rpool/data",
+    "target_host": "backup.local",
+    "target_dataset": "backup/data",
+    "mac_address": "AA:BB:CC:DD:EE:FF",
+}
+
+# Serialized once at import — almost every test writes this exact config,
+# so there's no reason to re-dump it per test.
+_DEFAULT_JOB_YAML = yaml.dump({"jobs": [_DEFAULT_JOB]}, Dumper=_DUMPER)
+
+# No test asserts on JobResult timestamps, so the helpers below share one
+# frozen datetime instead of calling datetime.now() per construction.
+_FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Pre-built _load_cfg return value for tests that don't exercise config
+# loading itself — lets them bypass the write/parse round-trip entirely.
+_DEFAULT_CFG_DICT = {"jobs": [_DEFAULT_JOB]}
+_DEFAULT_JOBS = jobs_from_config(_DEFAULT_CFG_DICT)
+
+
+def _emit_flat_job(job: dict) -> str:
+    """Hand-rolled YAML for the flat one-job schema.
+
+    Every value in the default job is a plain scalar, so a template beats
+    running the full yaml emitter; yaml.safe_load round-trips it exactly.
+    """
+    fields = "\n".join(f"  {key}: {value}" for key, value in job.items())
+    return f"jobs:\n-\n{fields}\n"
+
+
+@functools.lru_cache(maxsize=32)
+def _build_yaml(overrides_key: tuple) -> str:
+    """Serialize the default job with overrides applied, memoized per
+    override set — repeated identical _write_config calls cost one dict
+    lookup after the first."""
+    job = {**_DEFAULT_JOB, **dict(overrides_key)}
+    if all(isinstance(v, (str, int, float)) for v in job.values()):
+        return _emit_flat_job(job)
+    return yaml.dump({"jobs": [job]}, Dumper=_DUMPER)
+
 
 def _write_config(path: Path, **job_overrides: object) -> None:
     """Write a minimal valid config with one job named 'weekly'."""
-    job: dict = {
-        "name": "weekly",
-        "source": "rpool/data",
-        "target_host": "backup.local",
-        "target_dataset": "backup/data",
-        "mac_address": "AA:BB:CC:DD:EE:FF",
-    }
-    job.update(job_overrides)
-    path.write_text(yaml.dump({"jobs": [job]}))
+    if not job_overrides:
+        path.write_text(_DEFAULT_JOB_YAML)
+        return
+    try:
+        text = _build_yaml(tuple(sorted(job_overrides.items())))
+    except TypeError:  # unhashable override values can't be cache keys
+        job = {**_DEFAULT_JOB, **job_overrides}
+        text = yaml.dump({"jobs": [job]}, Dumper=_DUMPER)
+    path.write_text(text)
+
+
+@pytest.fixture(scope="class")
+def cls_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One writable directory per class — the handful of tests that still
+    write their own config overwrite the same files, so a fresh per-test
+    tmp_path is wasted mkdir/teardown work."""
+    return tmp_path_factory.mktemp("cls")
+
+
+@pytest.fixture(scope="module")
+def default_cfg(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One canonical config file, written once and shared by every test
+    that runs against the default single-job config."""
+    path = tmp_path_factory.mktemp("cli_cfg") / "config.yaml"
+    _write_config(path)
+    return path
+
+
+# Everything the CLI shells out to, mocked once at import. The autouse
+# fixture below re-points each target and resets the mocks per test, so
+# no test rebuilds a @patch decorator stack (or fresh MagicMocks).
+_CLI_MOCK_TARGETS = (
+    ("run_job", "hozo.core.job.run_job"),
+    ("notify", "hozo.notifications.notify.send_notification"),
+    ("run_command", "hozo.core.ssh.run_command"),
+    ("wait_for_ssh", "hozo.core.ssh.wait_for_ssh"),
+    ("wake", "hozo.core.wol.wake"),
+    ("uvicorn_run", "uvicorn.run"),
+    ("create_app", "hozo.api.routes.create_app"),
+)
+_CLI_MOCKS = {attr: Mock() for attr, _ in _CLI_MOCK_TARGETS}
+
+
+@pytest.fixture
+def stub_cfg(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Patch _load_cfg to hand the default config straight to the command,
+    skipping file I/O and YAML parsing. Returns the --config args to pass
+    (the path is never opened)."""
+    monkeypatch.setattr(
+        "hozo.cli._load_cfg", lambda config: (_DEFAULT_CFG_DICT, _DEFAULT_JOBS)
+    )
+    return ["--config", "unused.yaml"]
+
+
+@pytest.fixture(autouse=True)
+def cli_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    for attr, target in _CLI_MOCK_TARGETS:
+        mock = _CLI_MOCKS[attr]
+        mock.reset_mock(return_value=True, side_effect=True)
+        monkeypatch.setattr(target, mock)
+    ns = SimpleNamespace(**_CLI_MOCKS)
+    # Defaults that let the happy paths run; tests override as needed.
+    ns.run_command.return_value = (0, "", "")
+    ns.wait_for_ssh.return_value = True
+    return ns
 
 
 def _fail_result() -> JobResult:
     return JobResult(
         job_name="weekly",
         success=False,
-        started_at=datetime.now(timezone.utc),
-        finished_at=datetime.now(timezone.utc),
+        started_at=_FROZEN_TS,
+        finished_at=_FROZEN_TS,
         error="syncoid failed",
     )
 
@@ -41,8 +151,8 @@ def _ok_result() -> JobResult:
     return JobResult(
         job_name="weekly",
         success=True,
-        started_at=datetime.now(timezone.utc),
-        finished_at=datetime.now(timezone.utc),
+        started_at=_FROZEN_TS,
+        finished_at=_FROZEN_TS,
         snapshots_after=["backup/data@snap1"],
     )
 
@@ -53,50 +163,48 @@ def _ok_result() -> JobResult:
 class TestLoadCfgErrors:
     """_load_cfg calls sys.exit(1) for bad configs; CliRunner captures that."""
 
-    def test_missing_config_exits_1(self, tmp_path: Path) -> None:
-        result = CliRunner().invoke(
-            main, ["--config", str(tmp_path / "nope.yaml"), "jobs", "list"]
-        )
-        assert result.exit_code == 1
-
-    def test_empty_config_exits_1(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "empty.yaml"
-        cfg.write_text("")
-        result = CliRunner().invoke(main, ["--config", str(cfg), "jobs", "list"])
-        assert result.exit_code == 1
-
-    def test_validation_error_exits_1(self, tmp_path: Path) -> None:
-        """A job missing required fields triggers validate_config errors → exit 1."""
-        cfg = tmp_path / "bad.yaml"
-        cfg.write_text(yaml.dump({"jobs": [{"name": "x"}]}))
-        result = CliRunner().invoke(main, ["--config", str(cfg), "jobs", "list"])
-        assert result.exit_code == 1
+    @pytest.mark.parametrize(
+        "content",
+        [
+            None,  # file does not exist
+            "",  # empty file
+            yaml.dump({"jobs": [{"name": "x"}]}, Dumper=_DUMPER),  # fails validation
+        ],
+        ids=["missing", "empty", "invalid-job"],
+    )
+    def test_bad_config_exits_1(self, cls_tmp: Path, content: "str | None") -> None:
+        cfg = cls_tmp / "cfg.yaml"
+        if content is None:
+            cfg.unlink(missing_ok=True)
+        else:
+            cfg.write_text(content)
+        # Only the exit code matters here, so skip CliRunner's output
+        # capture and call Click's entry point directly.
+        with pytest.raises(SystemExit) as exc:
+            main.main(["--config", str(cfg), "jobs", "list"], standalone_mode=False)
+        assert exc.value.code == 1
 
 
 # ── jobs list ─────────────────────────────────────────────────────────────────
 
 
 class TestJobsList:
-    def test_shows_configured_job_name(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "jobs", "list"])
+    def test_shows_configured_job_name(self, stub_cfg: list[str]) -> None:
+        result = _RUNNER.invoke(main, [*stub_cfg, "jobs", "list"])
         assert result.exit_code == 0
         assert "weekly" in result.output
 
-    def test_shows_source_and_host(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "jobs", "list"])
+    def test_shows_source_and_host(self, stub_cfg: list[str]) -> None:
+        result = _RUNNER.invoke(main, [*stub_cfg, "jobs", "list"])
         assert "rpool/data" in result.output
         assert "backup.local" in result.output
 
     @patch("hozo.cli._load_cfg", return_value=({"jobs": []}, []))
-    def test_no_jobs_prints_message(self, mock_load: MagicMock, tmp_path: Path) -> None:
+    def test_no_jobs_prints_message(self, mock_load: MagicMock, cls_tmp: Path) -> None:
         """validate_config requires non-empty jobs, so we mock _load_cfg to reach the branch."""
-        cfg = tmp_path / "config.yaml"
+        cfg = cls_tmp / "config.yaml"
         cfg.write_text("placeholder: true")
-        result = CliRunner().invoke(main, ["--config", str(cfg), "jobs", "list"])
+        result = _RUNNER.invoke(main, ["--config", str(cfg), "jobs", "list"])
         assert result.exit_code == 0
         assert "No jobs configured." in result.output
 
@@ -105,51 +213,27 @@ class TestJobsList:
 
 
 class TestJobsRun:
-    @patch("hozo.notifications.notify.send_notification")
-    @patch("hozo.core.job.run_job")
     def test_success_exits_0_and_prints_checkmark(
-        self, mock_run: MagicMock, mock_notify: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, stub_cfg: list[str]
     ) -> None:
-        mock_run.return_value = _ok_result()
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "jobs", "run", "weekly"]
-        )
+        cli_mocks.run_job.return_value = _ok_result()
+        result = _RUNNER.invoke(main, [*stub_cfg, "jobs", "run", "weekly"])
         assert result.exit_code == 0
         assert "✓" in result.output or "completed" in result.output.lower()
 
-    @patch("hozo.notifications.notify.send_notification")
-    @patch("hozo.core.job.run_job")
     def test_failure_exits_2(
-        self, mock_run: MagicMock, mock_notify: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, stub_cfg: list[str]
     ) -> None:
-        mock_run.return_value = _fail_result()
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "jobs", "run", "weekly"]
-        )
+        cli_mocks.run_job.return_value = _fail_result()
+        result = _RUNNER.invoke(main, [*stub_cfg, "jobs", "run", "weekly"])
         assert result.exit_code == 2
 
-    def test_unknown_job_exits_1(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "jobs", "run", "nonexistent"]
-        )
-        assert result.exit_code == 1
-
-    @patch("hozo.notifications.notify.send_notification")
-    @patch("hozo.core.job.run_job")
     def test_notification_called_after_run(
-        self, mock_run: MagicMock, mock_notify: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, stub_cfg: list[str]
     ) -> None:
-        mock_run.return_value = _ok_result()
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        CliRunner().invoke(main, ["--config", str(cfg), "jobs", "run", "weekly"])
-        mock_notify.assert_called_once()
+        cli_mocks.run_job.return_value = _ok_result()
+        _RUNNER.invoke(main, [*stub_cfg, "jobs", "run", "weekly"])
+        cli_mocks.notify.assert_called_once()
 
 
 # ── status ────────────────────────────────────────────────────────────────────
@@ -157,147 +241,120 @@ class TestJobsRun:
 
 class TestStatus:
     @patch("hozo.cli._load_cfg", return_value=({"jobs": []}, []))
-    def test_no_jobs_prints_message(self, mock_load: MagicMock, tmp_path: Path) -> None:
+    def test_no_jobs_prints_message(self, mock_load: MagicMock, cls_tmp: Path) -> None:
         """validate_config requires non-empty jobs, so we mock _load_cfg to reach the branch."""
-        cfg = tmp_path / "config.yaml"
+        cfg = cls_tmp / "config.yaml"
         cfg.write_text("placeholder: true")
-        result = CliRunner().invoke(main, ["--config", str(cfg), "status"])
+        result = _RUNNER.invoke(main, ["--config", str(cfg), "status"])
         assert result.exit_code == 0
         assert "No jobs configured." in result.output
 
-    @patch("hozo.core.ssh.run_command", return_value=(0, "loads\n", ""))
-    @patch("hozo.core.ssh.wait_for_ssh", return_value=True)
     def test_ssh_reachable_runs_commands(
-        self, mock_wait: MagicMock, mock_cmd: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "status"])
+        cli_mocks.run_command.return_value = (0, "loads\n", "")
+        result = _RUNNER.invoke(main, ["--config", str(default_cfg), "status"])
         assert result.exit_code == 0
-        assert mock_cmd.called
+        assert cli_mocks.run_command.called
 
-    @patch("hozo.core.ssh.wait_for_ssh", return_value=False)
     def test_ssh_unreachable_prints_error(
-        self, mock_wait: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "status"])
+        cli_mocks.wait_for_ssh.return_value = False
+        result = _RUNNER.invoke(main, ["--config", str(default_cfg), "status"])
         assert result.exit_code == 0
         assert "unreachable" in result.output.lower()
 
-    @patch("hozo.core.ssh.run_command", return_value=(0, "sysinfo\n", ""))
-    @patch("hozo.core.ssh.wait_for_ssh", return_value=True)
     def test_status_with_named_job(
-        self, mock_wait: MagicMock, mock_cmd: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "status", "--job", "weekly"]
+        cli_mocks.run_command.return_value = (0, "sysinfo\n", "")
+        result = _RUNNER.invoke(
+            main, ["--config", str(default_cfg), "status", "--job", "weekly"]
         )
         assert result.exit_code == 0
 
-    def test_status_unknown_job_exits_1(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "status", "--job", "ghost"]
-        )
-        assert result.exit_code == 1
-
 
 # ── wake ─────────────────────────────────────────────────────────────────────
 
 
 class TestWake:
-    @patch("hozo.core.wol.wake")
-    def test_wake_valid_job_calls_wol(self, mock_wake: MagicMock, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "wake", "weekly"])
+    def test_wake_valid_job_calls_wol(
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
+    ) -> None:
+        result = _RUNNER.invoke(main, ["--config", str(default_cfg), "wake", "weekly"])
         assert result.exit_code == 0
-        mock_wake.assert_called_once()
+        cli_mocks.wake.assert_called_once()
         assert "AA:BB:CC:DD:EE:FF" in result.output
 
-    def test_wake_unknown_job_exits_1(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(main, ["--config", str(cfg), "wake", "ghost"])
-        assert result.exit_code == 1
-
 
 # ── shutdown ──────────────────────────────────────────────────────────────────
 
 
 class TestShutdown:
-    @patch("hozo.core.ssh.run_command", return_value=(0, "", ""))
     def test_shutdown_valid_job_sends_command(
-        self, mock_cmd: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "shutdown", "weekly"]
+        result = _RUNNER.invoke(
+            main, ["--config", str(default_cfg), "shutdown", "weekly"]
         )
         assert result.exit_code == 0
-        assert mock_cmd.called
+        assert cli_mocks.run_command.called
         assert "shutdown" in result.output.lower()
 
-    def test_shutdown_unknown_job_exits_1(self, tmp_path: Path) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "shutdown", "ghost"]
-        )
-        assert result.exit_code == 1
-
-    @patch(
-        "hozo.core.ssh.run_command",
-        side_effect=Exception("Connection reset"),
-    )
     def test_shutdown_exception_is_graceful(
-        self, mock_cmd: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
         """SSH raising (machine already off) should be caught and printed, not crash."""
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        result = CliRunner().invoke(
-            main, ["--config", str(cfg), "shutdown", "weekly"]
+        cli_mocks.run_command.side_effect = Exception("Connection reset")
+        result = _RUNNER.invoke(
+            main, ["--config", str(default_cfg), "shutdown", "weekly"]
         )
         assert result.exit_code == 0
         assert "Connection reset" in result.output or "shut down" in result.output.lower()
 
 
+# ── unknown job name ──────────────────────────────────────────────────────────
+
+
+class TestUnknownJob:
+    """Every job-taking command exits 1 for a name not in the config."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["jobs", "run", "ghost"],
+            ["status", "--job", "ghost"],
+            ["wake", "ghost"],
+            ["shutdown", "ghost"],
+        ],
+        ids=["jobs-run", "status", "wake", "shutdown"],
+    )
+    def test_unknown_job_exits_1(self, default_cfg: Path, args: list[str]) -> None:
+        with pytest.raises(SystemExit) as exc:
+            main.main(["--config", str(default_cfg), *args], standalone_mode=False)
+        assert exc.value.code == 1
+
+
 # ── serve ─────────────────────────────────────────────────────────────────────
 
 
 class TestServe:
-    @patch("uvicorn.run")
-    @patch("hozo.api.routes.create_app")
     def test_serve_starts_uvicorn(
-        self, mock_create: MagicMock, mock_uvicorn: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        mock_create.return_value = MagicMock()
-        result = CliRunner().invoke(
+        result = _RUNNER.invoke(
             main,
-            ["--config", str(cfg), "serve", "--host", "127.0.0.1", "--port", "9999"],
+            ["--config", str(default_cfg), "serve", "--host", "127.0.0.1", "--port", "9999"],
         )
         assert result.exit_code == 0
-        mock_uvicorn.assert_called_once()
-        call_kwargs = mock_uvicorn.call_args
+        cli_mocks.uvicorn_run.assert_called_once()
+        call_kwargs = cli_mocks.uvicorn_run.call_args
         assert call_kwargs[1]["host"] == "127.0.0.1"
         assert call_kwargs[1]["port"] == 9999
 
-    @patch("uvicorn.run")
-    @patch("hozo.api.routes.create_app")
     def test_serve_prints_startup_message(
-        self, mock_create: MagicMock, mock_uvicorn: MagicMock, tmp_path: Path
+        self, cli_mocks: SimpleNamespace, default_cfg: Path
     ) -> None:
-        cfg = tmp_path / "config.yaml"
-        _write_config(cfg)
-        mock_create.return_value = MagicMock()
-        result = CliRunner().invoke(main, ["--config", str(cfg), "serve"])
+        result = _RUNNER.invoke(main, ["--config", str(default_cfg), "serve"])
         assert "Starting" in result.output or "hozo" in result.output.lower()
@@ -1,12 +1,32 @@
 """Tests for configuration loading and validation."""
 
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 import yaml
 
 from hozo.config.loader import jobs_from_config, load_config, validate_config
 
+# libyaml-backed dumper when available
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Shared immutable job template — tests **unpack it and override fields
+# instead of rebuilding the same literal dict each time.
+_BASE_JOB = MappingProxyType(
+    {
+        "name": "test",
+        "source": "rpool/data",
+        "target_host": "host",
+        "target_dataset": "backup/data",
+        "mac_address": "AA:BB:CC:DD:EE:FF",
+    }
+)
+
+
+def _minimal_job(**overrides: object) -> dict:
+    return {**_BASE_JOB, **overrides}
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -25,7 +45,7 @@ class TestLoadConfig:
             ]
         }
         config_file = tmp_path / "config.yaml"
-        config_file.write_text(yaml.dump(config_data))
+        config_file.write_text(yaml.dump(config_data, Dumper=_DUMPER))
 
         result = load_config(config_file)
 
@@ -59,19 +79,8 @@ class TestLoadConfig:
 class TestValidateConfig:
     """Tests for validate_config function."""
 
-    def _minimal_job(self, **overrides: object) -> dict:
-        base = {
-            "name": "test",
-            "source": "rpool/data",
-            "target_host": "host",
-            "target_dataset": "backup/data",
-            "mac_address": "AA:BB:CC:DD:EE:FF",
-        }
-        base.update(overrides)
-        return base
-
     def test_valid_config_no_errors(self) -> None:
-        config = {"jobs": [self._minimal_job()]}
+        config = {"jobs": [_minimal_job()]}
         assert validate_config(config) == []
 
     def test_missing_jobs_key(self) -> None:
@@ -79,25 +88,25 @@ class TestValidateConfig:
         assert any("jobs" in e for e in errors)
 
     def test_invalid_mac(self) -> None:
-        config = {"jobs": [self._minimal_job(mac_address="NOTAMAC")]}
+        config = {"jobs": [_minimal_job(mac_address="NOTAMAC")]}
         errors = validate_config(config)
         assert any("mac_address" in e for e in errors)
 
     def test_invalid_schedule(self) -> None:
-        config = {"jobs": [self._minimal_job(schedule="every tuesday sometime")]}
+        config = {"jobs": [_minimal_job(schedule="every tuesday sometime")]}
         errors = validate_config(config)
         assert any("schedule" in e for e in errors)
 
     def test_valid_daily_schedule(self) -> None:
-        config = {"jobs": [self._minimal_job(schedule="daily 03:00")]}
+        config = {"jobs": [_minimal_job(schedule="daily 03:00")]}
         assert validate_config(config) == []
 
     def test_valid_weekly_schedule(self) -> None:
-        config = {"jobs": [self._minimal_job(schedule="weekly Sunday 02:30")]}
+        config = {"jobs": [_minimal_job(schedule="weekly Sunday 02:30")]}
         assert validate_config(config) == []
 
     def test_missing_required_field(self) -> None:
-        job = self._minimal_job()
+        job = _minimal_job()
         del job["target_host"]
         errors = validate_config({"jobs": [job]})
         assert any("target_host" in e for e in errors)
@@ -108,15 +117,7 @@ class TestJobsFromConfig:
 
     def test_creates_backup_job(self) -> None:
         config = {
-            "jobs": [
-                {
-                    "name": "nightly",
-                    "source": "rpool/data",
-                    "target_host": "backup.local",
-                    "target_dataset": "backup/data",
-                    "mac_address": "AA:BB:CC:DD:EE:FF",
-                }
-            ]
+            "jobs": [_minimal_job(name="nightly", target_host="backup.local")]
         }
         jobs = jobs_from_config(config)
         assert len(jobs) == 1
@@ -129,15 +130,7 @@ class TestJobsFromConfig:
     def test_respects_global_settings(self) -> None:
         config = {
             "settings": {"ssh_timeout": 300, "ssh_user": "backup"},
-            "jobs": [
-                {
-                    "name": "job",
-                    "source": "tank/data",
-                    "target_host": "host",
-                    "target_dataset": "backup/data",
-                    "mac_address": "AA:BB:CC:DD:EE:FF",
-                }
-            ],
+            "jobs": [_minimal_job(name="job", source="tank/data")],
         }
         jobs = jobs_from_config(config)
         assert jobs[0].timeout == 300
@@ -6,8 +6,10 @@ Tests cover both:
 - hozo.core.disk — SSH-based remote drive checks (runs on the orchestrator)
 """
 
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 
 from backupd.disk import (
     drive_summary,
@@ -24,71 +26,150 @@ from hozo.core.disk import (
     wait_for_remote_drive_active,
 )
 
+# Preallocated mocks, one per patched target — reset and re-pointed per
+# test instead of constructing a fresh Mock for every method.
+_DISK_MOCKS = {
+    name: Mock()
+    for name in (
+        "subprocess.run",
+        "backupd.disk.is_drive_active",
+        "backupd.disk.spin_up_drive",
+        "hozo.core.disk.run_command",
+        "hozo.core.disk.remote_drive_state",
+        "hozo.core.disk.is_remote_drive_active",
+        "hozo.core.disk.remote_spin_up_drive",
+    )
+}
+
+
+def _seq(*values: object):
+    """Plain callable returning the given values in order.
+
+    Cheaper than a Mock with a side_effect list, for polling loops where
+    no call metadata is ever asserted.
+    """
+    it = iter(values)
+    return lambda *args, **kwargs: next(it)
+
+
+def _ret(value: object):
+    """Plain callable returning a fixed value — a Mock without the overhead,
+    for stubs whose call history is never inspected."""
+    return lambda *args, **kwargs: value
+
+
+def _raise(exc: BaseException):
+    """Plain callable raising the given exception."""
+
+    def raiser(*args: object, **kwargs: object) -> None:
+        raise exc
+
+    return raiser
+
+
+def _hdparm_output(stdout: str) -> SimpleNamespace:
+    return SimpleNamespace(returncode=0, stdout=stdout)
+
+
+def _disk_mock(monkeypatch: pytest.MonkeyPatch, target: str) -> Mock:
+    mock = _DISK_MOCKS[target]
+    mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(target, mock)
+    return mock
+
+
+@pytest.fixture
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "subprocess.run")
+
+
+@pytest.fixture
+def mock_active(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "backupd.disk.is_drive_active")
+
+
+@pytest.fixture
+def mock_spinup(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "backupd.disk.spin_up_drive")
+
+
+@pytest.fixture
+def mock_cmd(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "hozo.core.disk.run_command")
+
+
+@pytest.fixture
+def mock_remote_state(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "hozo.core.disk.remote_drive_state")
+
+
+@pytest.fixture
+def mock_remote_active(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "hozo.core.disk.is_remote_drive_active")
+
+
+@pytest.fixture
+def mock_remote_spinup(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    return _disk_mock(monkeypatch, "hozo.core.disk.remote_spin_up_drive")
+
 
 class TestGetDriveState:
-    @patch("subprocess.run")
-    def test_returns_active_idle_from_hdparm(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="/dev/sda:\n  drive state is:  active/idle\n",
+    def test_returns_active_idle_from_hdparm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "subprocess.run",
+            _ret(_hdparm_output("/dev/sda:\n  drive state is:  active/idle\n")),
         )
         assert get_drive_state("/dev/sda") == "active/idle"
 
-    @patch("subprocess.run")
-    def test_returns_standby_from_hdparm(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="/dev/sda:\n  drive state is:  standby\n",
+    def test_returns_standby_from_hdparm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "subprocess.run",
+            _ret(_hdparm_output("/dev/sda:\n  drive state is:  standby\n")),
         )
         assert get_drive_state("/dev/sda") == "standby"
 
-    @patch("subprocess.run")
-    def test_returns_sleeping_from_hdparm(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="/dev/sda:\n  drive state is:  sleeping\n",
+    def test_returns_sleeping_from_hdparm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "subprocess.run",
+            _ret(_hdparm_output("/dev/sda:\n  drive state is:  sleeping\n")),
         )
         assert get_drive_state("/dev/sda") == "sleeping"
 
-    @patch("subprocess.run", side_effect=FileNotFoundError)
-    def test_falls_back_when_hdparm_missing(self, _: MagicMock, tmp_path: Path) -> None:
+    def test_falls_back_when_hdparm_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
         # When hdparm is absent and /sys/block doesn't exist → hdparm_unavailable
+        monkeypatch.setattr("subprocess.run", _raise(FileNotFoundError()))
         state = get_drive_state("/dev/nonexistent_drive_zzz")
         assert state == "hdparm_unavailable"
 
-    @patch("subprocess.run")
-    def test_returns_unknown_when_no_state_line(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="/dev/nvme0:\n  SSD present\n")
+    def test_returns_unknown_when_no_state_line(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "subprocess.run", _ret(_hdparm_output("/dev/nvme0:\n  SSD present\n"))
+        )
         assert get_drive_state("/dev/nvme0") == "unknown"
 
 
 class TestIsDriveActive:
-    @patch("backupd.disk.get_drive_state", return_value="active/idle")
-    def test_true_when_active_idle(self, _: MagicMock) -> None:
-        assert is_drive_active("/dev/sda") is True
-
-    @patch("backupd.disk.get_drive_state", return_value="standby")
-    def test_false_when_standby(self, _: MagicMock) -> None:
-        assert is_drive_active("/dev/sda") is False
-
-    @patch("backupd.disk.get_drive_state", return_value="sleeping")
-    def test_false_when_sleeping(self, _: MagicMock) -> None:
-        assert is_drive_active("/dev/sda") is False
-
-    @patch("backupd.disk.get_drive_state", return_value="hdparm_unavailable")
-    def test_true_when_hdparm_unavailable(self, _: MagicMock) -> None:
-        # When we can't determine state we optimistically assume active
-        assert is_drive_active("/dev/sda") is True
-
-    @patch("backupd.disk.get_drive_state", return_value="unknown")
-    def test_true_when_unknown(self, _: MagicMock) -> None:
-        assert is_drive_active("/dev/sda") is True
+    @pytest.mark.parametrize(
+        ("state", "expected"),
+        [
+            ("active/idle", True),
+            ("standby", False),
+            ("sleeping", False),
+            # When we can't determine state we optimistically assume active
+            ("hdparm_unavailable", True),
+            ("unknown", True),
+        ],
+    )
+    def test_state_mapping(
+        self, monkeypatch: pytest.MonkeyPatch, state: str, expected: bool
+    ) -> None:
+        monkeypatch.setattr("backupd.disk.get_drive_state", _ret(state))
+        assert is_drive_active("/dev/sda") is expected
 
 
 class TestSpinUpDrive:
-    @patch("subprocess.run")
-    def test_returns_true_on_success(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="1+0 records in\n", stderr="")
+    def test_returns_true_on_success(self, mock_run: Mock) -> None:
+        mock_run.return_value = Mock(returncode=0, stdout="1+0 records in\n", stderr="")
         result = spin_up_drive("/dev/sda")
         assert result is True
         # Verify it's a dd sector-read, not a write
@@ -97,42 +178,40 @@ class TestSpinUpDrive:
         assert "if=/dev/sda" in cmd
         assert "of=/dev/null" in cmd
 
-    @patch("subprocess.run")
-    def test_returns_false_on_nonzero_exit(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="permission denied")
+    def test_returns_false_on_nonzero_exit(self, mock_run: Mock) -> None:
+        mock_run.return_value = Mock(returncode=1, stdout="", stderr="permission denied")
         assert spin_up_drive("/dev/sda") is False
 
-    @patch("subprocess.run", side_effect=Exception("device busy"))
-    def test_returns_false_on_exception(self, _: MagicMock) -> None:
+    def test_returns_false_on_exception(self, mock_run: Mock) -> None:
+        mock_run.side_effect = Exception("device busy")
         assert spin_up_drive("/dev/sda") is False
 
 
 class TestWaitForDriveActive:
-    @patch("backupd.disk.is_drive_active", return_value=True)
-    def test_returns_true_immediately_when_already_active(self, _: MagicMock) -> None:
+    def test_returns_true_immediately_when_already_active(self, mock_active: Mock) -> None:
+        mock_active.return_value = True
         assert wait_for_drive_active("/dev/sda", timeout=5) is True
 
-    @patch("backupd.disk.spin_up_drive")
-    @patch("backupd.disk.is_drive_active", side_effect=[False, False, True])
     def test_spins_up_then_polls_until_active(
-        self, mock_active: MagicMock, mock_spinup: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, mock_spinup: Mock
     ) -> None:
+        monkeypatch.setattr("backupd.disk.is_drive_active", _seq(False, False, True))
         result = wait_for_drive_active("/dev/sda", timeout=10, poll_interval=0.01)
         assert result is True
         # spin_up_drive should be called exactly once (on first standby detection)
         mock_spinup.assert_called_once_with("/dev/sda")
 
-    @patch("backupd.disk.spin_up_drive")
-    @patch("backupd.disk.is_drive_active", return_value=False)
-    def test_returns_false_on_timeout(self, mock_active: MagicMock, mock_spinup: MagicMock) -> None:
+    def test_returns_false_on_timeout(
+        self, mock_active: Mock, mock_spinup: Mock
+    ) -> None:
+        mock_active.return_value = False
         result = wait_for_drive_active("/dev/sda", timeout=1, poll_interval=0.1)
         assert result is False
 
-    @patch("backupd.disk.spin_up_drive")
-    @patch("backupd.disk.is_drive_active", side_effect=[False, True])
     def test_does_not_spin_up_when_disabled(
-        self, mock_active: MagicMock, mock_spinup: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, mock_spinup: Mock
     ) -> None:
+        monkeypatch.setattr("backupd.disk.is_drive_active", _seq(False, True))
         result = wait_for_drive_active(
             "/dev/sda", timeout=5, poll_interval=0.01, spin_up_on_standby=False
         )
@@ -141,35 +220,35 @@ class TestWaitForDriveActive:
 
 
 class TestDriveSummary:
-    @patch("backupd.disk.get_drive_state", return_value="standby")
-    @patch("backupd.disk._read_io_completions", return_value=42)
-    def test_summary_structure(self, _io: MagicMock, _state: MagicMock) -> None:
+    def test_summary_structure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("backupd.disk.get_drive_state", _ret("standby"))
+        monkeypatch.setattr("backupd.disk._read_io_completions", _ret(42))
         summary = drive_summary("/dev/sda")
         assert summary["device"] == "/dev/sda"
         assert summary["state"] == "standby"
         assert summary["active"] is False  # standby → not active
         assert summary["io_completions"] == 42
 
-    @patch("backupd.disk.get_drive_state", return_value="active/idle")
-    @patch("backupd.disk._read_io_completions", return_value=1337)
-    def test_summary_active_drive(self, _io: MagicMock, _state: MagicMock) -> None:
+    def test_summary_active_drive(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("backupd.disk.get_drive_state", _ret("active/idle"))
+        monkeypatch.setattr("backupd.disk._read_io_completions", _ret(1337))
         summary = drive_summary("/dev/sda")
         assert summary["active"] is True
 
 
 class TestHasRecentIoActivity:
-    @patch("backupd.disk._read_io_completions", side_effect=[100, 105])
-    def test_true_when_counter_changes(self, _: MagicMock) -> None:
+    def test_true_when_counter_changes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("backupd.disk._read_io_completions", _seq(100, 105))
         result = has_recent_io_activity("/dev/sda", probe_interval=0.01)
         assert result is True
 
-    @patch("backupd.disk._read_io_completions", side_effect=[100, 100])
-    def test_false_when_counter_static(self, _: MagicMock) -> None:
+    def test_false_when_counter_static(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("backupd.disk._read_io_completions", _seq(100, 100))
         result = has_recent_io_activity("/dev/sda", probe_interval=0.01)
         assert result is False
 
-    @patch("backupd.disk._read_io_completions", return_value=None)
-    def test_returns_none_when_sysfs_unavailable(self, _: MagicMock) -> None:
+    def test_returns_none_when_sysfs_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("backupd.disk._read_io_completions", _ret(None))
         assert has_recent_io_activity("/dev/sda", probe_interval=0.01) is None
 
 
@@ -179,51 +258,46 @@ class TestHasRecentIoActivity:
 
 
 class TestRemoteDriveState:
-    @patch("hozo.core.disk.run_command")
-    def test_returns_active_idle(self, mock_cmd: MagicMock) -> None:
+    def test_returns_active_idle(self, mock_cmd: Mock) -> None:
         mock_cmd.return_value = (0, "  drive state is:  active/idle\n", "")
         state = remote_drive_state("backup.local", "/dev/sda")
         assert state == "active/idle"
 
-    @patch("hozo.core.disk.run_command")
-    def test_returns_standby(self, mock_cmd: MagicMock) -> None:
+    def test_returns_standby(self, mock_cmd: Mock) -> None:
         mock_cmd.return_value = (0, "  drive state is:  standby\n", "")
         assert remote_drive_state("backup.local", "/dev/sda") == "standby"
 
-    @patch("hozo.core.disk.run_command")
-    def test_returns_hdparm_unavailable(self, mock_cmd: MagicMock) -> None:
+    def test_returns_hdparm_unavailable(self, mock_cmd: Mock) -> None:
         mock_cmd.return_value = (0, "hdparm_unavailable\n", "")
         assert remote_drive_state("backup.local", "/dev/sda") == "hdparm_unavailable"
 
-    @patch("hozo.core.disk.run_command")
-    def test_returns_unknown_when_no_keyword_found(self, mock_cmd: MagicMock) -> None:
+    def test_returns_unknown_when_no_keyword_found(self, mock_cmd: Mock) -> None:
         """stdout has content but neither 'drive state is:' nor 'hdparm_unavailable' → 'unknown'."""
         mock_cmd.return_value = (0, "some other output\n", "")
         assert remote_drive_state("backup.local", "/dev/sda") == "unknown"
 
-    @patch("hozo.core.disk.run_command", side_effect=Exception("connection refused"))
-    def test_returns_unknown_on_ssh_failure(self, _: MagicMock) -> None:
+    def test_returns_unknown_on_ssh_failure(self, mock_cmd: Mock) -> None:
+        mock_cmd.side_effect = Exception("connection refused")
         assert remote_drive_state("dead.host", "/dev/sda") == "unknown"
 
 
 class TestIsRemoteDriveActive:
-    @patch("hozo.core.disk.remote_drive_state", return_value="active/idle")
-    def test_true_when_active(self, _: MagicMock) -> None:
+    def test_true_when_active(self, mock_remote_state: Mock) -> None:
+        mock_remote_state.return_value = "active/idle"
         assert is_remote_drive_active("backup.local", "/dev/sda") is True
 
-    @patch("hozo.core.disk.remote_drive_state", return_value="standby")
-    def test_false_when_standby(self, _: MagicMock) -> None:
+    def test_false_when_standby(self, mock_remote_state: Mock) -> None:
+        mock_remote_state.return_value = "standby"
         assert is_remote_drive_active("backup.local", "/dev/sda") is False
 
-    @patch("hozo.core.disk.remote_drive_state", return_value="unknown")
-    def test_true_when_unknown(self, _: MagicMock) -> None:
+    def test_true_when_unknown(self, mock_remote_state: Mock) -> None:
         # Unknown state → assume ready (optimistic)
+        mock_remote_state.return_value = "unknown"
         assert is_remote_drive_active("backup.local", "/dev/sda") is True
 
 
 class TestRemoteSpinUpDrive:
-    @patch("hozo.core.disk.run_command")
-    def test_returns_true_on_success(self, mock_cmd: MagicMock) -> None:
+    def test_returns_true_on_success(self, mock_cmd: Mock) -> None:
         mock_cmd.return_value = (0, "1+0 records in\n", "")
         assert remote_spin_up_drive("backup.local", "/dev/sda") is True
         # Verify the command sent is a dd sector-read
@@ -232,45 +306,45 @@ class TestRemoteSpinUpDrive:
         assert "/dev/sda" in cmd_str
         assert "/dev/null" in cmd_str
 
-    @patch("hozo.core.disk.run_command")
-    def test_returns_false_on_nonzero_exit(self, mock_cmd: MagicMock) -> None:
+    def test_returns_false_on_nonzero_exit(self, mock_cmd: Mock) -> None:
         mock_cmd.return_value = (1, "", "permission denied")
         assert remote_spin_up_drive("backup.local", "/dev/sda") is False
 
-    @patch("hozo.core.disk.run_command", side_effect=Exception("timeout"))
-    def test_returns_false_on_exception(self, _: MagicMock) -> None:
+    def test_returns_false_on_exception(self, mock_cmd: Mock) -> None:
+        mock_cmd.side_effect = Exception("timeout")
         assert remote_spin_up_drive("backup.local", "/dev/sda") is False
 
 
 class TestWaitForRemoteDriveActive:
-    @patch("hozo.core.disk.is_remote_drive_active", return_value=True)
-    def test_returns_true_when_already_active(self, _: MagicMock) -> None:
+    def test_returns_true_when_already_active(self, mock_remote_active: Mock) -> None:
+        mock_remote_active.return_value = True
         assert wait_for_remote_drive_active("backup.local", "/dev/sda", timeout=5) is True
 
-    @patch("hozo.core.disk.remote_spin_up_drive")
-    @patch("hozo.core.disk.is_remote_drive_active", side_effect=[False, False, True])
     def test_spins_up_on_first_standby_then_polls(
-        self, mock_active: MagicMock, mock_spinup: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, mock_remote_spinup: Mock
     ) -> None:
+        monkeypatch.setattr(
+            "hozo.core.disk.is_remote_drive_active", _seq(False, False, True)
+        )
         result = wait_for_remote_drive_active(
             "backup.local", "/dev/sda", timeout=10, poll_interval=0.01
         )
         assert result is True
-        mock_spinup.assert_called_once()
+        mock_remote_spinup.assert_called_once()
 
-    @patch("hozo.core.disk.remote_spin_up_drive")
-    @patch("hozo.core.disk.is_remote_drive_active", return_value=False)
-    def test_returns_false_on_timeout(self, mock_active: MagicMock, mock_spinup: MagicMock) -> None:
+    def test_returns_false_on_timeout(
+        self, mock_remote_active: Mock, mock_remote_spinup: Mock
+    ) -> None:
+        mock_remote_active.return_value = False
         result = wait_for_remote_drive_active(
             "backup.local", "/dev/sda", timeout=1, poll_interval=0.1
         )
         assert result is False
 
-    @patch("hozo.core.disk.remote_spin_up_drive")
-    @patch("hozo.core.disk.is_remote_drive_active", side_effect=[False, True])
     def test_does_not_spinup_when_disabled(
-        self, mock_active: MagicMock, mock_spinup: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, mock_remote_spinup: Mock
     ) -> None:
+        monkeypatch.setattr("hozo.core.disk.is_remote_drive_active", _seq(False, True))
         result = wait_for_remote_drive_active(
             "backup.local",
             "/dev/sda",
@@ -279,4 +353,4 @@ class TestWaitForRemoteDriveActive:
             spin_up_on_standby=False,
         )
         assert result is True
-        mock_spinup.assert_not_called()
+        mock_remote_spinup.assert_not_called()
@@ -1,21 +1,104 @@
 """Tests for job orchestration."""
 
+import functools
+from dataclasses import replace
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
+
+from hozo.core.backup import SyncoidError
 from hozo.core.job import BackupJob, JobResult, run_job, run_restore_job
 
+# The preallocated mocks below are per-interpreter state — keep this
+# module on a single pytest-xdist worker so they are never shared.
+pytestmark = pytest.mark.xdist_group(name="job_tests")
+
+# Immutable timestamps shared by the JobResult tests.
+_JR_START = datetime(2024, 1, 1, 0, 0, 0)
+_JR_END = datetime(2024, 1, 1, 0, 5, 0)
+
+_BASE_JOB = BackupJob(
+    name="test",
+    source_dataset="rpool/data",
+    target_host="backup.local",
+    target_dataset="backup/data",
+    mac_address="AA:BB:CC:DD:EE:FF",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_job(key: frozenset) -> BackupJob:
+    return replace(_BASE_JOB, **dict(key))
+
 
 def _make_job(**kwargs: object) -> BackupJob:
-    defaults = dict(
-        name="test",
-        source_dataset="rpool/data",
-        target_host="backup.local",
-        target_dataset="backup/data",
-        mac_address="AA:BB:CC:DD:EE:FF",
-    )
-    defaults.update(kwargs)  # type: ignore[arg-type]
-    return BackupJob(**defaults)  # type: ignore[arg-type]
+    """Build (or reuse) a job. The runners never mutate their job, so
+    identical kwarg sets share one cached instance."""
+    return _cached_job(frozenset(kwargs.items()))
+
+
+# Everything run_job/run_restore_job call out to, mocked once at import.
+# The job_mocks fixture re-points each target and resets the mocks per
+# test — no per-test @patch decorator stacks.
+_JOB_MOCK_TARGETS = (
+    ("wake", "hozo.core.job.wake"),
+    ("wait_for_ssh", "hozo.core.job.wait_for_ssh"),
+    ("run_syncoid", "hozo.core.job.run_syncoid"),
+    ("run_restore_syncoid", "hozo.core.job.run_restore_syncoid"),
+    ("list_remote_snapshots", "hozo.core.job.list_remote_snapshots"),
+    ("run_command", "hozo.core.job.run_command"),
+    ("wait_for_drive", "hozo.core.job.wait_for_remote_drive_active"),
+)
+_JOB_MOCKS = {attr: Mock() for attr, _ in _JOB_MOCK_TARGETS}
+_SHUTDOWN_MOCK = Mock()
+
+# Pre-built exceptions for side_effects — Mock raises the same instance
+# on every call, so there's no need to construct one per test.
+_RESET_ERR = Exception("Connection reset by peer")
+_SYNCOID_ERR = SyncoidError(1, "err")
+_SYNCOID_OUTPUT_ERR = SyncoidError(1, stderr="dataset not found", stdout="partial output")
+
+_SLEEP_CALLS: list[float] = []
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Retry delays must never actually sleep during tests. A bare
+    list.append stands in for time.sleep; the one test that cares about
+    the delay asserts on the recorded values."""
+    _SLEEP_CALLS.clear()
+    monkeypatch.setattr("hozo.core.job.time.sleep", _SLEEP_CALLS.append)
+    return _SLEEP_CALLS
+
+
+@pytest.fixture
+def job_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    for attr, target in _JOB_MOCK_TARGETS:
+        mock = _JOB_MOCKS[attr]
+        mock.reset_mock(return_value=True, side_effect=True)
+        monkeypatch.setattr(target, mock)
+    ns = SimpleNamespace(**_JOB_MOCKS)
+    # A fully successful run by default; tests override the step they
+    # want to fail (or the output they want to inspect).
+    ns.wake.return_value = True
+    ns.wait_for_ssh.return_value = True
+    ns.run_syncoid.return_value = (True, "")
+    ns.run_restore_syncoid.return_value = (True, "")
+    ns.list_remote_snapshots.return_value = []
+    ns.run_command.return_value = (0, "", "")
+    ns.wait_for_drive.return_value = True
+    return ns
+
+
+@pytest.fixture
+def mock_shutdown(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub _maybe_shutdown itself, for tests that don't care whether the
+    shutdown command goes through run_command."""
+    _SHUTDOWN_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("hozo.core.job._maybe_shutdown", _SHUTDOWN_MOCK)
+    return _SHUTDOWN_MOCK
 
 
 class TestBackupJob:
@@ -41,13 +124,11 @@ class TestJobResult:
     """Tests for JobResult dataclass."""
 
     def test_duration_seconds_calculated(self) -> None:
-        started = datetime(2024, 1, 1, 0, 0, 0)
-        finished = datetime(2024, 1, 1, 0, 5, 0)
         result = JobResult(
             job_name="test",
             success=True,
-            started_at=started,
-            finished_at=finished,
+            started_at=_JR_START,
+            finished_at=_JR_END,
         )
         assert result.duration_seconds == 300.0
 
@@ -59,35 +140,8 @@ class TestJobResult:
 class TestRunJob:
     """Tests for run_job function."""
 
-    def _mock_successful_run(self) -> tuple:
-        """Return a set of patches for a fully successful job run."""
-        mock_wake = MagicMock(return_value=True)
-        mock_wait = MagicMock(return_value=True)
-        mock_syncoid = MagicMock(return_value=(True, ""))
-        mock_snapshots = MagicMock(return_value=["backup/data@2024-01-01"])
-        mock_run_cmd = MagicMock(return_value=(0, "", ""))
-        return mock_wake, mock_wait, mock_syncoid, mock_snapshots, mock_run_cmd
-
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_successful_job_returns_success(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_run_cmd: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = ["backup/data@snap1"]
-        mock_run_cmd.return_value = (0, "", "")
+    def test_successful_job_returns_success(self, job_mocks: SimpleNamespace) -> None:
+        job_mocks.list_remote_snapshots.return_value = ["backup/data@snap1"]
 
         job = _make_job()
         result = run_job(job)
@@ -96,140 +150,63 @@ class TestRunJob:
         assert result.job_name == "test"
         assert len(result.snapshots_after) == 1
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_ssh_timeout_returns_failure(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = False  # SSH never came up
+    def test_ssh_timeout_returns_failure(self, job_mocks: SimpleNamespace) -> None:
+        job_mocks.wait_for_ssh.return_value = False  # SSH never came up
 
         job = _make_job()
         result = run_job(job)
 
         assert result.success is False
         assert result.error is not None
-        assert "SSH" in result.error
-
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_shutdown_called_after_success(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_run_cmd: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = []
-        mock_run_cmd.return_value = (0, "", "")
+        # the error message is anchored: "SSH did not become available…"
+        assert result.error.startswith("SSH")
 
-        job = _make_job(shutdown_after=True)
-        run_job(job)
-
-        # run_command should be called for shutdown
-        mock_run_cmd.assert_called()
-        shutdown_calls = [c for c in mock_run_cmd.call_args_list if "shutdown" in str(c)]
-        assert len(shutdown_calls) == 1
-
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_no_shutdown_when_disabled(
+    @pytest.mark.parametrize(
+        ("shutdown_after", "expected_shutdown_calls"), [(True, 1), (False, 0)]
+    )
+    def test_shutdown_follows_option(
         self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_run_cmd: MagicMock,
-        mock_sleep: MagicMock,
+        job_mocks: SimpleNamespace,
+        shutdown_after: bool,
+        expected_shutdown_calls: int,
     ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = []
-        mock_run_cmd.return_value = (0, "", "")
-
-        job = _make_job(shutdown_after=False)
-        run_job(job)
+        run_job(_make_job(shutdown_after=shutdown_after))
 
-        # run_command should NOT be called (no shutdown, no snapshot commands beyond list)
-        mock_run_cmd.assert_not_called()
+        # The shutdown command string is the second positional arg, so
+        # inspect it directly rather than repr'ing whole call objects.
+        # run_command is only ever used for shutdown here, so with the
+        # option off it must not be called at all.
+        shutdown_calls = [
+            c for c in job_mocks.run_command.call_args_list if "shutdown" in c.args[1]
+        ]
+        assert len(shutdown_calls) == expected_shutdown_calls
+        assert job_mocks.run_command.called is bool(shutdown_after)
 
 
 class TestRunRestoreJob:
     """Tests for the break-glass restore job runner."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_restore_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_successful_restore_returns_success(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_restore: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = True
-        mock_restore.return_value = (True, "")
-
+    def test_successful_restore_returns_success(self, job_mocks: SimpleNamespace) -> None:
         result = run_restore_job(_make_job())
 
         assert result.success is True
         assert result.job_name == "test"
-        mock_restore.assert_called_once()
+        job_mocks.run_restore_syncoid.assert_called_once()
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_restore_fails_when_ssh_unavailable(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait.return_value = False
+    def test_restore_fails_when_ssh_unavailable(self, job_mocks: SimpleNamespace) -> None:
+        job_mocks.wait_for_ssh.return_value = False
 
         result = run_restore_job(_make_job())
 
         assert result.success is False
         assert result.error is not None
-        assert "SSH" in result.error
+        # the error message is anchored: "SSH did not become available…"
+        assert result.error.startswith("SSH")
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_restore_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_restore_returns_failure_on_syncoid_error(
-        self,
-        mock_wake: MagicMock,
-        mock_wait: MagicMock,
-        mock_restore: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace
     ) -> None:
-        from hozo.core.backup import SyncoidError
-
-        mock_wake.return_value = True
-        mock_wait.return_value = True
-        mock_restore.side_effect = SyncoidError(1, "dataset not found", "")
+        job_mocks.run_restore_syncoid.side_effect = SyncoidError(1, "dataset not found", "")
 
         result = run_restore_job(_make_job())
 
@@ -244,110 +221,51 @@ class TestRunRestoreJob:
 class TestRunJobBackupDevice:
     """Tests for the backup_device drive-spinup branch."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_remote_drive_active")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_backup_device_drive_ready(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_drive: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_cmd: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_drive.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = []
-        mock_cmd.return_value = (0, "", "")
-
+    def test_backup_device_drive_ready(self, job_mocks: SimpleNamespace) -> None:
         job = _make_job(backup_device="/dev/sdb", disk_spinup_timeout=60)
         result = run_job(job)
 
         assert result.success is True
-        mock_drive.assert_called_once()
+        job_mocks.wait_for_drive.assert_called_once()
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.wait_for_remote_drive_active")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_backup_device_not_ready_returns_failure(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_drive: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace
     ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_drive.return_value = False  # drive didn't spin up
+        job_mocks.wait_for_drive.return_value = False  # drive didn't spin up
 
         job = _make_job(backup_device="/dev/sdb", disk_spinup_timeout=60)
         result = run_job(job)
 
         assert result.success is False
         assert result.error is not None
-        assert "/dev/sdb" in result.error or "spin up" in result.error.lower() or "Drive" in result.error
+        # normalize once instead of three mixed-case substring scans
+        err = result.error.lower()
+        assert "/dev/sdb" in err or "spin up" in err or "drive" in err
 
 
 class TestRunJobGenericException:
     """Generic Exception (e.g. FileNotFoundError) in the retry loop."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job._maybe_shutdown")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_file_not_found_exhausts_retries(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_shutdown: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace, mock_shutdown: Mock
     ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.side_effect = FileNotFoundError("syncoid not found in PATH")
+        job_mocks.run_syncoid.side_effect = FileNotFoundError("syncoid not found in PATH")
 
         job = _make_job(retries=2, retry_delay=0)
         result = run_job(job)
 
         assert result.success is False
         assert result.error is not None
-        assert mock_syncoid.call_count == 2  # retried once
+        assert job_mocks.run_syncoid.call_count == 2  # retried once
 
 
 class TestMaybeShutdownException:
     """_maybe_shutdown exceptions are swallowed (machine already off)."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_shutdown_exception_does_not_crash_job(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_cmd: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace
     ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = []
-        mock_cmd.side_effect = Exception("Connection reset by peer")
+        job_mocks.run_command.side_effect = _RESET_ERR
 
         job = _make_job(shutdown_after=True)
         result = run_job(job)
@@ -356,143 +274,72 @@ class TestMaybeShutdownException:
         assert result.success is True
 
 
-class TestRunJobLogLinesCapture:
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
+class TestLogLinesCapture:
+    """syncoid output ends up in log_lines for both runners."""
+
+    @pytest.mark.parametrize(
+        ("runner", "mock_attr", "output"),
+        [
+            (run_job, "run_syncoid", "Sending snaps\nTransfer complete\n"),
+            (run_restore_job, "run_restore_syncoid", "Pulling snaps\nDone\n"),
+        ],
+        ids=["backup", "restore"],
+    )
     def test_syncoid_output_appears_in_log_lines(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_cmd: MagicMock,
-        mock_sleep: MagicMock,
-    ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.return_value = (True, "Sending snaps\nTransfer complete\n")
-        mock_snapshots.return_value = []
-        mock_cmd.return_value = (0, "", "")
-
-        result = run_job(_make_job())
-        combined = "\n".join(result.log_lines)
-        assert "Sending snaps" in combined or "Transfer complete" in combined
-
-
-class TestRestoreJobOutputCapture:
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_restore_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
-    def test_syncoid_output_in_restore_log_lines(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_restore: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace, runner, mock_attr: str, output: str
     ) -> None:
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_restore.return_value = (True, "Pulling snaps\nDone\n")
+        getattr(job_mocks, mock_attr).return_value = (True, output)
 
-        result = run_restore_job(_make_job())
+        result = runner(_make_job())
 
         assert result.success is True
-        combined = "\n".join(result.log_lines)
-        assert "Pulling snaps" in combined or "Done" in combined
+        # Scan line by line — no need to join the whole log into one string
+        expected = output.splitlines()
+        assert any(s in line for line in result.log_lines for s in expected)
 
 
 class TestSyncoidErrorOutputCapture:
     """Cover the SyncoidError branch that includes stdout/stderr output (lines 187-195)."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job._maybe_shutdown")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_syncoid_error_output_appended_to_log_lines(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_shutdown: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace, mock_shutdown: Mock
     ) -> None:
-        from hozo.core.backup import SyncoidError
-
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.side_effect = SyncoidError(
-            1,
-            stderr="dataset not found",
-            stdout="partial output",
-        )
+        job_mocks.run_syncoid.side_effect = _SYNCOID_OUTPUT_ERR
 
         job = _make_job(retries=1, retry_delay=0)
         result = run_job(job)
 
         assert result.success is False
-        combined = "\n".join(result.log_lines)
         # The error output should appear somewhere in the log
-        assert "dataset not found" in combined or "partial output" in combined
+        assert any(
+            s in line
+            for line in result.log_lines
+            for s in ("dataset not found", "partial output")
+        )
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job._maybe_shutdown")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_syncoid_error_retries_with_delay(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_shutdown: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace, mock_shutdown: Mock
     ) -> None:
         """With retries=2, retry_delay is called between attempts."""
-        from hozo.core.backup import SyncoidError
-
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.side_effect = SyncoidError(1, "err")
+        job_mocks.run_syncoid.side_effect = _SYNCOID_ERR
 
         job = _make_job(retries=2, retry_delay=5)
         result = run_job(job)
 
         assert result.success is False
         # sleep(retry_delay) called between the 2 attempts
-        mock_sleep.assert_any_call(5)
+        assert 5 in _SLEEP_CALLS
 
 
 class TestMaybeShutdownWarning:
     """Cover the exit_code warning branch in _maybe_shutdown (line 263)."""
 
-    @patch("hozo.core.job.time.sleep")
-    @patch("hozo.core.job.run_command")
-    @patch("hozo.core.job.list_remote_snapshots")
-    @patch("hozo.core.job.run_syncoid")
-    @patch("hozo.core.job.wait_for_ssh")
-    @patch("hozo.core.job.wake")
     def test_nonzero_shutdown_exit_code_does_not_crash(
-        self,
-        mock_wake: MagicMock,
-        mock_wait_ssh: MagicMock,
-        mock_syncoid: MagicMock,
-        mock_snapshots: MagicMock,
-        mock_cmd: MagicMock,
-        mock_sleep: MagicMock,
+        self, job_mocks: SimpleNamespace
     ) -> None:
         """If shutdown command returns exit code 1, we just log a warning."""
-        mock_wake.return_value = True
-        mock_wait_ssh.return_value = True
-        mock_syncoid.return_value = (True, "")
-        mock_snapshots.return_value = []
         # Return exit_code=1 (not 0 or -1) to trigger the warning branch
-        mock_cmd.return_value = (1, "", "permission denied")
+        job_mocks.run_command.return_value = (1, "", "permission denied")
 
         job = _make_job(shutdown_after=True)
         result = run_job(job)
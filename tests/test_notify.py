@@ -1,91 +1,218 @@
 """Tests for notification dispatchers."""
 
+import dataclasses
+import logging
+import socket
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
 
 from hozo.core.job import JobResult
-from hozo.notifications.notify import _build_body, _build_subject, send_notification
+from hozo.notifications.notify import (
+    _HTTP_RETRIES,
+    _build_body,
+    _build_digest_body,
+    _build_digest_subject,
+    _build_subject,
+    _dispatch,
+    _post_with_retry,
+    flush,
+    send_notification,
+)
+
+# One shared successful result; failure variants are cheap replace()
+# copies. snapshots_after is a tuple so the baseline is safe to share.
+_BASELINE = JobResult(
+    job_name="weekly",
+    success=True,
+    started_at=datetime(2024, 6, 1, 3, 0, 0),
+    finished_at=datetime(2024, 6, 1, 3, 5, 30),
+    snapshots_after=("backup/data@2024-06-01",),  # type: ignore[arg-type]
+)
 
 
 def _make_result(success: bool = True, error: str | None = None) -> JobResult:
-    return JobResult(
-        job_name="weekly",
-        success=success,
-        started_at=datetime(2024, 6, 1, 3, 0, 0),
-        finished_at=datetime(2024, 6, 1, 3, 5, 30),
-        error=error,
-        snapshots_after=["backup/data@2024-06-01"],
+    return dataclasses.replace(_BASELINE, success=success, error=error)
+
+
+# Shared read-only configs — send_notification never mutates its config,
+# and the proxy makes sure a test can't either.
+_NTFY_CFG = MappingProxyType({"settings": {"notifications": {"ntfy_topic": "hozo-test"}}})
+_NTFY_ALERTS_CFG = MappingProxyType(
+    {"settings": {"notifications": {"ntfy_topic": "hozo-alerts"}}}
+)
+_PUSHOVER_CFG = MappingProxyType(
+    {
+        "settings": {
+            "notifications": {
+                "pushover_token": "tok_abc",
+                "pushover_user": "usr_xyz",
+            }
+        }
+    }
+)
+_SMTP_NO_TO_CFG = MappingProxyType(
+    {"settings": {"notifications": {"smtp": {"host": "mail.example.com", "port": 587}}}}
+)
+_SMTP_CFG = MappingProxyType(
+    {
+        "settings": {
+            "notifications": {
+                "smtp": {
+                    "host": "mail.example.com",
+                    "port": 587,
+                    "from_addr": "hozo@example.com",
+                    "to_addr": "admin@example.com",
+                    "use_tls": True,
+                }
+            }
+        }
+    }
+)
+
+# Preallocated mocks for the two transports, re-pointed and reset per
+# test by the fixtures below instead of per-method @patch decorators.
+_POST_MOCK = MagicMock()
+_SMTP_MOCK = MagicMock()
+
+# The code under test only ever calls .raise_for_status() on a response,
+# so one shared no-op stands in for every successful HTTP reply.
+_OK_RESPONSE = SimpleNamespace(raise_for_status=lambda: None)
+
+
+def _capture_post(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, dict]]:
+    """Swap httpx.post for a closure recording only (url, headers) — the
+    pieces these tests actually assert on — instead of Mock's full
+    call-args bookkeeping."""
+    captured: list[tuple[str, dict]] = []
+
+    def fake_post(url: str, **kwargs: object) -> SimpleNamespace:
+        captured.append((url, kwargs.get("headers", {})))  # type: ignore[arg-type]
+        return _OK_RESPONSE
+
+    monkeypatch.setattr(
+        "hozo.notifications.notify._get_client", lambda: SimpleNamespace(post=fake_post)
     )
+    return captured
 
 
-class TestBuildSubjectAndBody:
-    def test_success_subject(self) -> None:
-        subj = _build_subject(_make_result(success=True))
-        assert "SUCCESS" in subj
-        assert "weekly" in subj
+@pytest.fixture
+def mock_post(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    _POST_MOCK.reset_mock(return_value=True, side_effect=True)
+    _POST_MOCK.return_value = _OK_RESPONSE
+    monkeypatch.setattr(
+        "hozo.notifications.notify._get_client", lambda: SimpleNamespace(post=_POST_MOCK)
+    )
+    return _POST_MOCK
+
+
+@pytest.fixture
+def mock_smtp_cls(monkeypatch: pytest.MonkeyPatch):
+    from hozo.notifications import notify
 
-    def test_failure_subject(self) -> None:
-        subj = _build_subject(_make_result(success=False))
-        assert "FAILED" in subj
+    notify._smtp_pool.clear()  # no pooled connection may leak between tests
+    _SMTP_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("hozo.notifications.notify.smtplib.SMTP", _SMTP_MOCK)
+    # DNS pre-check must not hit a real resolver for mail.example.com
+    monkeypatch.setattr(
+        "hozo.notifications.notify.socket.getaddrinfo", lambda *a, **kw: [object()]
+    )
+    yield _SMTP_MOCK
+    notify._smtp_pool.clear()
 
-    def test_body_contains_job_name(self) -> None:
-        body = _build_body(_make_result())
-        assert "weekly" in body
 
-    def test_body_contains_error_when_present(self) -> None:
-        body = _build_body(_make_result(success=False, error="syncoid crashed"))
-        assert "syncoid crashed" in body
+class TestBuildSubjectAndBody:
+    @pytest.mark.parametrize(
+        ("builder", "kwargs", "needle"),
+        [
+            (_build_subject, {}, "SUCCESS"),
+            (_build_subject, {}, "weekly"),
+            (_build_subject, {"success": False}, "FAILED"),
+            (_build_body, {}, "weekly"),
+            (_build_body, {"success": False, "error": "syncoid crashed"}, "syncoid crashed"),
+        ],
+        ids=[
+            "subject-success",
+            "subject-job-name",
+            "subject-failed",
+            "body-job-name",
+            "body-error",
+        ],
+    )
+    def test_contains(self, builder, kwargs: dict, needle: str) -> None:
+        assert needle in builder(_make_result(**kwargs))
 
     def test_body_contains_duration(self) -> None:
-        body = _build_body(_make_result())
+        body = _build_body(_BASELINE)
         assert "330" in body or "5" in body  # 5.5 min or 330s
 
 
 class TestSendNotification:
     def test_no_notifications_config_does_nothing(self) -> None:
-        result = _make_result()
+        result = _BASELINE
         # Should not raise even with empty config
-        send_notification(result, {})
-
-    @patch("hozo.notifications.notify.httpx.post")
-    def test_ntfy_post_called_on_success(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(raise_for_status=MagicMock())
-        config = {"settings": {"notifications": {"ntfy_topic": "hozo-test"}}}
-        send_notification(_make_result(success=True), config)
-        mock_post.assert_called_once()
-        url = mock_post.call_args[0][0]
+        _dispatch(result, {})
+
+    def test_ntfy_post_called_on_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        captured = _capture_post(monkeypatch)
+        _dispatch(_BASELINE, _NTFY_CFG)
+        assert len(captured) == 1
+        url, _ = captured[0]
         assert "hozo-test" in url
 
-    @patch("hozo.notifications.notify.httpx.post")
-    def test_ntfy_high_priority_on_failure(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(raise_for_status=MagicMock())
-        config = {"settings": {"notifications": {"ntfy_topic": "hozo-alerts"}}}
-        send_notification(_make_result(success=False), config)
-        headers = mock_post.call_args[1]["headers"]
+    def test_ntfy_high_priority_on_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        captured = _capture_post(monkeypatch)
+        _dispatch(_make_result(success=False), _NTFY_ALERTS_CFG)
+        _, headers = captured[0]
         assert headers["Priority"] == "high"
 
-    @patch("hozo.notifications.notify.httpx.post")
-    def test_pushover_post_called(self, mock_post: MagicMock) -> None:
-        mock_post.return_value = MagicMock(raise_for_status=MagicMock())
-        config = {
-            "settings": {
-                "notifications": {
-                    "pushover_token": "tok_abc",
-                    "pushover_user": "usr_xyz",
-                }
-            }
-        }
-        send_notification(_make_result(), config)
-        mock_post.assert_called_once()
-        assert "pushover" in mock_post.call_args[0][0]
-
-    @patch("hozo.notifications.notify.smtplib.SMTP")
-    def test_email_not_sent_without_to_addr(self, mock_smtp: MagicMock) -> None:
-        config = {
-            "settings": {"notifications": {"smtp": {"host": "mail.example.com", "port": 587}}}
-        }
-        send_notification(_make_result(), config)
-        mock_smtp.assert_not_called()
+    def test_pushover_post_called(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        captured = _capture_post(monkeypatch)
+        _dispatch(_BASELINE, _PUSHOVER_CFG)
+        assert len(captured) == 1
+        assert "pushover" in captured[0][0]
+
+    def test_email_not_sent_without_to_addr(self, mock_smtp_cls: MagicMock) -> None:
+        _dispatch(_BASELINE, _SMTP_NO_TO_CFG)
+        mock_smtp_cls.assert_not_called()
+
+
+class TestBatching:
+    def test_burst_coalesces_into_one_post(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        captured = _capture_post(monkeypatch)
+        for _ in range(5):
+            send_notification(_BASELINE, _NTFY_CFG)
+        assert flush(timeout=5.0)
+        assert len(captured) == 1
+
+    def test_digest_subject_counts_failures(self) -> None:
+        results = [_BASELINE, _make_result(success=False, error="boom")]
+        assert "1/2" in _build_digest_subject(results)
+        assert _build_digest_subject([_BASELINE]).endswith("1 jobs succeeded")
+
+    def test_digest_body_lists_each_job(self) -> None:
+        results = [_BASELINE, _make_result(success=False, error="boom")]
+        body = _build_digest_body(results)
+        assert body.count("weekly:") == 2
+        assert "boom" in body
+
+
+class TestQueuedDelivery:
+    def test_send_notification_delivers_on_worker_thread(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        captured = _capture_post(monkeypatch)
+        send_notification(_BASELINE, _NTFY_CFG)
+        assert flush(timeout=5.0)
+        assert len(captured) == 1
+
+    def test_flush_returns_immediately_when_queue_empty(self) -> None:
+        assert flush(timeout=0.5)
 
 
 # ── Additional coverage ───────────────────────────────────────────────────────
@@ -114,96 +241,111 @@ class TestBuildBodyAttempts:
 
 
 class TestNtfyException:
-    @patch("hozo.notifications.notify.httpx.post", side_effect=Exception("network error"))
     def test_ntfy_exception_does_not_raise(self, mock_post: MagicMock) -> None:
         """ntfy failures are caught silently — a network error must not crash."""
-        config = {"settings": {"notifications": {"ntfy_topic": "hozo-test"}}}
-        send_notification(_make_result(success=True), config)  # must not raise
+        mock_post.side_effect = Exception("network error")
+        _dispatch(_BASELINE, _NTFY_CFG)  # must not raise
 
-    @patch("hozo.notifications.notify.httpx.post")
     def test_ntfy_raise_for_status_error_caught(self, mock_post: MagicMock) -> None:
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.side_effect = Exception("HTTP 500")
-        mock_post.return_value = mock_resp
-        config = {"settings": {"notifications": {"ntfy_topic": "hozo-alerts"}}}
-        send_notification(_make_result(), config)  # must not raise
+        mock_post.return_value = MagicMock()
+        mock_post.return_value.raise_for_status.side_effect = Exception("HTTP 500")
+        _dispatch(_BASELINE, _NTFY_ALERTS_CFG)  # must not raise
+
+
+class TestPostWithRetry:
+    """Retry policy: transport errors and 5xx retry, 4xx never does."""
+
+    # Real responses so _post_with_retry's own raise_for_status classifies
+    # the status — a mock would bypass the 4xx/5xx branch under test.
+    _REQ = httpx.Request("POST", "https://ntfy.sh/hozo-test")
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("hozo.notifications.notify.time.sleep", lambda s: None)
+
+    def _response(self, status_code: int) -> httpx.Response:
+        return httpx.Response(status_code, request=self._REQ)
+
+    def test_transport_error_retried_then_succeeds(self, mock_post: MagicMock) -> None:
+        mock_post.side_effect = [httpx.ConnectError("refused"), self._response(200)]
+
+        resp = _post_with_retry("https://ntfy.sh/hozo-test")
+
+        assert resp.status_code == 200
+        assert mock_post.call_count == 2
+
+    def test_5xx_retried_then_succeeds(self, mock_post: MagicMock) -> None:
+        mock_post.side_effect = [self._response(503), self._response(200)]
+
+        resp = _post_with_retry("https://ntfy.sh/hozo-test")
+
+        assert resp.status_code == 200
+        assert mock_post.call_count == 2
+
+    def test_4xx_raises_after_single_attempt(self, mock_post: MagicMock) -> None:
+        mock_post.return_value = self._response(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _post_with_retry("https://ntfy.sh/hozo-test")
+
+        assert mock_post.call_count == 1
+
+    def test_all_attempts_fail_is_logged_and_swallowed(
+        self, mock_post: MagicMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        mock_post.side_effect = httpx.ConnectError("refused")
+
+        with caplog.at_level(logging.ERROR, logger="hozo.notifications.notify"):
+            _dispatch(_BASELINE, _NTFY_CFG)  # must not raise
+
+        assert mock_post.call_count == _HTTP_RETRIES
+        assert "Failed to send ntfy notification" in caplog.text
 
 
 class TestPushoverException:
-    @patch("hozo.notifications.notify.httpx.post", side_effect=Exception("timeout"))
     def test_pushover_exception_does_not_raise(self, mock_post: MagicMock) -> None:
-        config = {
-            "settings": {
-                "notifications": {
-                    "pushover_token": "tok_abc",
-                    "pushover_user": "usr_xyz",
-                }
-            }
-        }
-        send_notification(_make_result(), config)  # must not raise
+        mock_post.side_effect = Exception("timeout")
+        _dispatch(_BASELINE, _PUSHOVER_CFG)  # must not raise
 
 
 class TestSendEmail:
-    @patch("hozo.notifications.notify.smtplib.SMTP")
     def test_email_sent_calls_smtp_constructor(self, mock_smtp_cls: MagicMock) -> None:
-        mock_smtp = MagicMock()
-        mock_smtp_cls.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-        config = {
-            "settings": {
-                "notifications": {
-                    "smtp": {
-                        "host": "mail.example.com",
-                        "port": 587,
-                        "from_addr": "hozo@example.com",
-                        "to_addr": "admin@example.com",
-                        "use_tls": True,
-                    }
-                }
-            }
-        }
-        send_notification(_make_result(), config)
-        mock_smtp_cls.assert_called_once_with("mail.example.com", 587, timeout=15)
+        _dispatch(_BASELINE, _SMTP_CFG)
+        mock_smtp_cls.assert_called_once_with("mail.example.com", 587, timeout=30)
+
+    def test_email_skipped_when_host_unresolvable(
+        self, mock_smtp_cls: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_such_host(*args: object, **kwargs: object) -> None:
+            raise socket.gaierror("Name or service not known")
+
+        monkeypatch.setattr("hozo.notifications.notify.socket.getaddrinfo", no_such_host)
+        _dispatch(_BASELINE, _SMTP_CFG)  # must not raise
+        mock_smtp_cls.assert_not_called()
 
-    @patch("hozo.notifications.notify.smtplib.SMTP")
     def test_email_tls_calls_starttls(self, mock_smtp_cls: MagicMock) -> None:
         from hozo.notifications.notify import _send_email
 
-        mock_smtp = MagicMock()
-        mock_smtp_cls.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
-
         _send_email(
             {"host": "h", "port": 587, "to_addr": "x@x.com", "use_tls": True},
             "sub",
             "body",
         )
-        mock_smtp.starttls.assert_called_once()
+        mock_smtp_cls.return_value.starttls.assert_called_once()
 
-    @patch("hozo.notifications.notify.smtplib.SMTP")
     def test_email_no_tls_skips_starttls(self, mock_smtp_cls: MagicMock) -> None:
         from hozo.notifications.notify import _send_email
 
-        mock_smtp = MagicMock()
-        mock_smtp_cls.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
-
         _send_email(
             {"host": "h", "port": 25, "to_addr": "x@x.com", "use_tls": False},
             "sub",
             "body",
         )
-        mock_smtp.starttls.assert_not_called()
+        mock_smtp_cls.return_value.starttls.assert_not_called()
 
-    @patch("hozo.notifications.notify.smtplib.SMTP")
     def test_email_login_called_with_credentials(self, mock_smtp_cls: MagicMock) -> None:
         from hozo.notifications.notify import _send_email
 
-        mock_smtp = MagicMock()
-        mock_smtp_cls.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_cls.return_value.__exit__ = MagicMock(return_value=False)
-
         _send_email(
             {
                 "host": "h",
@@ -216,12 +358,23 @@ class TestSendEmail:
             "sub",
             "body",
         )
-        mock_smtp.login.assert_called_once_with("hozo", "secret")
+        mock_smtp_cls.return_value.login.assert_called_once_with("hozo", "secret")
+
+    def test_email_reuses_pooled_connection(self, mock_smtp_cls: MagicMock) -> None:
+        """A second send to the same server reuses the open connection."""
+        from hozo.notifications.notify import _send_email
+
+        cfg = {"host": "h", "port": 587, "to_addr": "x@x.com", "use_tls": False}
+        _send_email(cfg, "sub1", "body1")
+        _send_email(cfg, "sub2", "body2")
+
+        mock_smtp_cls.assert_called_once()
+        assert mock_smtp_cls.return_value.send_message.call_count == 2
 
-    @patch("hozo.notifications.notify.smtplib.SMTP", side_effect=Exception("refused"))
     def test_email_exception_does_not_raise(self, mock_smtp_cls: MagicMock) -> None:
         from hozo.notifications.notify import _send_email
 
+        mock_smtp_cls.side_effect = Exception("refused")
         _send_email(
             {"host": "h", "port": 587, "to_addr": "x@x.com"},
             "sub",
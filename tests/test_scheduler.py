@@ -1,7 +1,6 @@
 """Tests for the APScheduler-based job scheduler."""
 
 import threading
-import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -12,6 +11,9 @@ import yaml
 from hozo.core.job import BackupJob, JobResult
 from hozo.scheduler.runner import HozoScheduler, parse_schedule
 
+# libyaml-backed dumper when available
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TestParseSchedule:
     """Tests for parse_schedule."""
@@ -46,25 +48,36 @@ class TestParseSchedule:
             fields = {f.name: f for f in trigger.fields}
             assert str(fields["day_of_week"]) == abbrev
 
+    def test_parse_schedule_is_cached(self) -> None:
+        assert parse_schedule("daily 03:00") is parse_schedule("daily 03:00")
+
 
 class TestHozoScheduler:
     """Tests for HozoScheduler."""
 
+    # Serialized config text per schedule — identical configs across tests
+    # reuse one dump instead of re-serializing.
+    _CFG_TEXT_CACHE: dict = {}
+
     def _write_config(self, tmp_path: Path, schedule: str = "daily 03:00") -> Path:
-        config = {
-            "jobs": [
-                {
-                    "name": "test_job",
-                    "source": "rpool/data",
-                    "target_host": "backup.local",
-                    "target_dataset": "backup/data",
-                    "mac_address": "AA:BB:CC:DD:EE:FF",
-                    "schedule": schedule,
-                }
-            ]
-        }
+        text = self._CFG_TEXT_CACHE.get(schedule)
+        if text is None:
+            config = {
+                "jobs": [
+                    {
+                        "name": "test_job",
+                        "source": "rpool/data",
+                        "target_host": "backup.local",
+                        "target_dataset": "backup/data",
+                        "mac_address": "AA:BB:CC:DD:EE:FF",
+                        "schedule": schedule,
+                    }
+                ]
+            }
+            text = yaml.dump(config, Dumper=_DUMPER)
+            self._CFG_TEXT_CACHE[schedule] = text
         path = tmp_path / "config.yaml"
-        path.write_text(yaml.dump(config))
+        path.write_text(text)
         return path
 
     def test_load_jobs_registers_scheduled_job(self, tmp_path: Path) -> None:
@@ -95,7 +108,7 @@ class TestHozoScheduler:
             ]
         }
         path = tmp_path / "config.yaml"
-        path.write_text(yaml.dump(config))
+        path.write_text(yaml.dump(config, Dumper=_DUMPER))
 
         scheduler = HozoScheduler()
         count = scheduler.load_jobs_from_config(path)
@@ -125,6 +138,18 @@ class TestHozoScheduler:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="class")
+def scheduler():
+    """One started scheduler shared by the fire tests — APScheduler's
+    thread/executor bootstrap is paid once per class. Tests swap in their
+    own on_result callback and unregister their jobs on the way out; the
+    stop test builds its own instance since it must shut one down."""
+    s = HozoScheduler()
+    s.start()
+    yield s
+    s.stop(wait=False)
+
+
 class TestSchedulerIntegration:
     """
     Integration tests that start a real BackgroundScheduler and verify jobs
@@ -145,9 +170,11 @@ class TestSchedulerIntegration:
         )
 
     @patch("hozo.scheduler.runner.run_job")
-    def test_scheduled_job_actually_fires(self, mock_run_job: MagicMock) -> None:
+    def test_scheduled_job_actually_fires(
+        self, mock_run_job: MagicMock, scheduler: HozoScheduler
+    ) -> None:
         """
-        Schedule a job to fire 1 second from now using DateTrigger.
+        Schedule a job to fire 100 ms from now using DateTrigger.
         Verify the job function and the on_result callback are both invoked.
         """
         from apscheduler.triggers.date import DateTrigger
@@ -167,29 +194,31 @@ class TestSchedulerIntegration:
             received_results.append(result)
             fired_event.set()
 
-        scheduler = HozoScheduler(on_result=on_result)
+        scheduler._on_result = on_result
         job = self._make_job()
 
-        # Schedule to fire 1 second from now
-        fire_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+        # Schedule to fire 100 ms from now
+        fire_at = datetime.now(timezone.utc) + timedelta(milliseconds=100)
         scheduler.schedule_job(job, DateTrigger(run_date=fire_at, timezone="UTC"))
-        scheduler.start()
 
         try:
-            fired = fired_event.wait(timeout=10)
+            fired = fired_event.wait(timeout=3)
         finally:
-            scheduler.stop(wait=False)
+            scheduler.remove_all_jobs()
+            scheduler._on_result = None
 
-        assert fired, "Job did not fire within 10 seconds — scheduler is not working"
+        assert fired, "Job did not fire within 3 seconds — scheduler is not working"
         assert mock_run_job.called, "run_job was never called by the scheduler"
         assert len(received_results) == 1
         assert received_results[0].job_name == "integration_test_job"
         assert received_results[0].success is True
 
     @patch("hozo.scheduler.runner.run_job")
-    def test_job_fires_multiple_times_with_interval(self, mock_run_job: MagicMock) -> None:
+    def test_job_fires_multiple_times_with_interval(
+        self, mock_run_job: MagicMock, scheduler: HozoScheduler
+    ) -> None:
         """
-        Use an IntervalTrigger every 0.5 s and verify the job fires at least twice,
+        Use an IntervalTrigger every 50 ms and verify the job fires at least twice,
         proving the scheduler keeps running between invocations.
         """
         from apscheduler.triggers.interval import IntervalTrigger
@@ -211,19 +240,17 @@ class TestSchedulerIntegration:
 
         mock_run_job.side_effect = fake_run_job
 
-        scheduler = HozoScheduler()
         job = self._make_job()
-        scheduler.schedule_job(job, IntervalTrigger(seconds=0.5))
-        scheduler.start()
+        scheduler.schedule_job(job, IntervalTrigger(seconds=0.05))
 
         try:
-            fired_twice = reached_two.wait(timeout=10)
+            fired_twice = reached_two.wait(timeout=2)
         finally:
-            scheduler.stop(wait=False)
+            scheduler.remove_all_jobs()
 
         assert (
             fired_twice
-        ), f"Job only fired {call_count} times in 10 s — scheduler may have stopped early"
+        ), f"Job only fired {call_count} times in 2 s — scheduler may have stopped early"
         assert call_count >= 2
 
     @patch("hozo.scheduler.runner.run_job")
@@ -234,12 +261,14 @@ class TestSchedulerIntegration:
         from apscheduler.triggers.interval import IntervalTrigger
 
         fired_after_stop = threading.Event()
+        first_fire = threading.Event()
         stopped = threading.Event()
         call_count = 0
 
         def fake_run_job(job: BackupJob) -> JobResult:
             nonlocal call_count
             call_count += 1
+            first_fire.set()
             if stopped.is_set():
                 fired_after_stop.set()
             return JobResult(
@@ -256,15 +285,13 @@ class TestSchedulerIntegration:
         scheduler.schedule_job(job, IntervalTrigger(seconds=0.2))
         scheduler.start()
 
-        # Let it fire at least once
-        time.sleep(0.5)
+        # Let it fire at least once, then stop as soon as it has
+        assert first_fire.wait(timeout=5), "Job never fired before stop"
         scheduler.stop(wait=True)
         stopped.set()
 
         # Wait briefly — any rogue fire would set fired_after_stop
-        time.sleep(0.5)
-
-        assert not fired_after_stop.is_set(), "Job fired after scheduler was stopped"
+        assert not fired_after_stop.wait(timeout=0.3), "Job fired after scheduler was stopped"
         assert call_count >= 1, "Job should have fired at least once before stop"
 
 
@@ -276,7 +303,7 @@ class TestSchedulerEdgeCases:
 
     def _write_config(self, tmp_path: Path, jobs: list) -> Path:
         path = tmp_path / "config.yaml"
-        path.write_text(yaml.dump({"jobs": jobs}))
+        path.write_text(yaml.dump({"jobs": jobs}, Dumper=_DUMPER))
         return path
 
     def test_load_empty_config_returns_zero(self, tmp_path: Path) -> None:
@@ -340,6 +367,61 @@ class TestSchedulerEdgeCases:
         # Must not raise even though callback raises
         scheduler._run_job_wrapper(scheduler.jobs[0])
 
+    @patch("hozo.scheduler.runner.run_job")
+    def test_submit_job_runs_wrapper_and_fires_callback(
+        self, mock_run_job: MagicMock, tmp_path: Path
+    ) -> None:
+        """submit_job returns a Future that runs the job and fires on_result."""
+        fake_result = JobResult(
+            job_name="weekly",
+            success=True,
+            started_at=datetime.now(timezone.utc),
+        )
+        mock_run_job.return_value = fake_result
+
+        callback = MagicMock()
+        scheduler = HozoScheduler(on_result=callback)
+        path = self._write_config(
+            tmp_path,
+            [
+                {
+                    "name": "weekly",
+                    "source": "rpool/data",
+                    "target_host": "host",
+                    "target_dataset": "backup/data",
+                    "mac_address": "AA:BB:CC:DD:EE:FF",
+                    "schedule": "daily 03:00",
+                }
+            ],
+        )
+        scheduler.load_jobs_from_config(path)
+
+        future = scheduler.submit_job("weekly")
+
+        assert future is not None
+        assert future.result(timeout=5) is None  # the wrapper returns nothing
+        mock_run_job.assert_called_once_with(scheduler.jobs[0])
+        callback.assert_called_once_with(fake_result)
+
+    def test_submit_job_unknown_name_returns_none(self, tmp_path: Path) -> None:
+        """submit_job for a nonexistent job returns None without submitting."""
+        path = self._write_config(
+            tmp_path,
+            [
+                {
+                    "name": "weekly",
+                    "source": "rpool/data",
+                    "target_host": "host",
+                    "target_dataset": "backup/data",
+                    "mac_address": "AA:BB:CC:DD:EE:FF",
+                    "schedule": "daily 03:00",
+                }
+            ],
+        )
+        scheduler = HozoScheduler()
+        scheduler.load_jobs_from_config(path)
+        assert scheduler.submit_job("does_not_exist") is None
+
     def test_run_job_now_unknown_name_returns_none(self, tmp_path: Path) -> None:
         """run_job_now for a nonexistent job returns None."""
         path = self._write_config(
@@ -1,42 +1,157 @@
 """Tests for SSH connectivity and remote command execution."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from hozo.core.ssh import run_command, wait_for_ssh
+import paramiko
+import pytest
+
+from hozo.core.ssh import run_command, run_command_stream, wait_for_ssh
+
+# Preallocated mocks, re-pointed and reset per test by the fixtures below —
+# no per-test @patch decorator stacks.
+_CONN_MOCK = MagicMock()
+_SSH_CLS_MOCK = MagicMock()
+_SELECT_MOCK = MagicMock()
+
+# Captured before any fixture patches paramiko.SSHClient (hozo.core.ssh
+# shares the real module, so the patch is visible here too).
+_REAL_SSH_CLIENT = paramiko.SSHClient
+
+_EMPTY = b""
+
+
+class _FakeSock:
+    """Stand-in for the socket returned by create_connection — a plain
+    class instead of a per-test MagicMock with synthesized __enter__/__exit__."""
+
+    def __enter__(self) -> "_FakeSock":
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+
+_FAKE_SOCK = _FakeSock()
+
+
+def _one_shot_read(data: bytes):
+    """read(n) side effect: the whole payload on the first call, EOF after."""
+    remaining = iter((data,))
+    return lambda *_: next(remaining, _EMPTY)
+
+
+def _make_mock_client(
+    stdout_data: "str | bytes" = _EMPTY, stderr_data: "str | bytes" = _EMPTY, exit_code: int = 0
+) -> MagicMock:
+    """Fake SSHClient whose exec_command yields the given output streams."""
+    if isinstance(stdout_data, str):
+        stdout_data = stdout_data.encode()
+    if isinstance(stderr_data, str):
+        stderr_data = stderr_data.encode()
+    mock_stdout = MagicMock()
+    mock_stdout.read.side_effect = _one_shot_read(stdout_data)
+    mock_stdout.channel.recv_exit_status.return_value = exit_code
+
+    mock_stderr = MagicMock()
+    mock_stderr.read.side_effect = _one_shot_read(stderr_data)
+
+    # spec'd against the real class: attribute access resolves against a
+    # fixed table instead of auto-creating child mocks, and typos in
+    # method names fail loudly.
+    mock_client = MagicMock(spec=_REAL_SSH_CLIENT)
+    mock_client.exec_command.return_value = (MagicMock(), mock_stdout, mock_stderr)
+    return mock_client
+
+
+@pytest.fixture
+def mock_conn(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    _CONN_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("hozo.core.ssh.socket.create_connection", _CONN_MOCK)
+    return _CONN_MOCK
+
+
+@pytest.fixture
+def mock_ssh_cls(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    _SSH_CLS_MOCK.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("hozo.core.ssh.paramiko.SSHClient", _SSH_CLS_MOCK)
+    return _SSH_CLS_MOCK
+
+
+@pytest.fixture
+def mock_select(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Stub select.select — the fake channels below have no file descriptor."""
+    _SELECT_MOCK.reset_mock(return_value=True, side_effect=True)
+    _SELECT_MOCK.return_value = ([], [], [])
+    monkeypatch.setattr("hozo.core.ssh.select.select", _SELECT_MOCK)
+    return _SELECT_MOCK
+
+
+class _FakeChannel:
+    """Scripted channel for run_command_stream: a queue of
+    ("stdout" | "stderr", bytes) events drained in order; the exit status
+    becomes ready once the queue is empty."""
+
+    def __init__(self, events: list, exit_code: int = 0) -> None:
+        self._events = list(events)
+        self._exit_code = exit_code
+
+    def _next_is(self, kind: str) -> bool:
+        return bool(self._events) and self._events[0][0] == kind
+
+    def recv_ready(self) -> bool:
+        return self._next_is("stdout")
+
+    def recv_stderr_ready(self) -> bool:
+        return self._next_is("stderr")
+
+    def recv(self, size: int) -> bytes:
+        return self._events.pop(0)[1]
+
+    def recv_stderr(self, size: int) -> bytes:
+        return self._events.pop(0)[1]
+
+    def exit_status_ready(self) -> bool:
+        return not self._events
+
+    def recv_exit_status(self) -> int:
+        return self._exit_code
+
+
+def _make_stream_client(channel: _FakeChannel) -> MagicMock:
+    """Fake SSHClient whose exec_command stdout is backed by the channel."""
+    mock_stdout = MagicMock()
+    mock_stdout.channel = channel
+    mock_client = MagicMock(spec=_REAL_SSH_CLIENT)
+    mock_client.exec_command.return_value = (MagicMock(), mock_stdout, MagicMock())
+    return mock_client
 
 
 class TestWaitForSsh:
     """Tests for wait_for_ssh."""
 
-    @patch("hozo.core.ssh.socket.create_connection")
     def test_returns_true_when_reachable(self, mock_conn: MagicMock) -> None:
         """Should return True immediately when SSH port is reachable."""
-        mock_conn.return_value.__enter__ = lambda s: s
-        mock_conn.return_value.__exit__ = MagicMock(return_value=False)
+        mock_conn.return_value = _FAKE_SOCK
 
         result = wait_for_ssh("backup.local", timeout=10)
 
         assert result is True
         mock_conn.assert_called_once()
 
-    @patch("hozo.core.ssh.socket.create_connection", side_effect=OSError)
-    @patch("hozo.core.ssh.time.sleep")
-    def test_returns_false_on_timeout(self, mock_sleep: MagicMock, mock_conn: MagicMock) -> None:
+    def test_returns_false_on_timeout(self, mock_conn: MagicMock) -> None:
         """Should return False when SSH never becomes available."""
+        mock_conn.side_effect = OSError
         # timeout=1 with poll_interval=5 → loop exits immediately after one attempt
-        result = wait_for_ssh("unreachable.host", timeout=1, poll_interval=5.0)
+        result = wait_for_ssh(
+            "unreachable.host", timeout=1, poll_interval=5.0, sleep=lambda *_: None
+        )
         assert result is False
 
-    @patch("hozo.core.ssh.socket.create_connection")
     def test_succeeds_on_second_attempt(self, mock_conn: MagicMock) -> None:
         """Should pass even if first attempt fails."""
-        mock_conn.side_effect = [
-            OSError,
-            MagicMock(__enter__=lambda s: s, __exit__=MagicMock(return_value=False)),
-        ]
+        mock_conn.side_effect = [OSError, _FAKE_SOCK]
 
-        with patch("hozo.core.ssh.time.sleep"):
-            result = wait_for_ssh("backup.local", timeout=30, poll_interval=1.0)
+        result = wait_for_ssh("backup.local", timeout=30, poll_interval=1.0, sleep=lambda *_: None)
 
         assert result is True
 
@@ -44,43 +159,48 @@ class TestWaitForSsh:
 class TestRunCommand:
     """Tests for run_command via paramiko."""
 
-    def _make_mock_client(
-        self, stdout_data: str = "", stderr_data: str = "", exit_code: int = 0
-    ) -> MagicMock:
-        mock_stdout = MagicMock()
-        mock_stdout.read.return_value = stdout_data.encode()
-        mock_stdout.channel.recv_exit_status.return_value = exit_code
-
-        mock_stderr = MagicMock()
-        mock_stderr.read.return_value = stderr_data.encode()
-
-        mock_client = MagicMock()
-        mock_client.exec_command.return_value = (MagicMock(), mock_stdout, mock_stderr)
-        return mock_client
-
-    @patch("hozo.core.ssh.paramiko.SSHClient")
     def test_returns_tuple_on_success(self, mock_ssh_cls: MagicMock) -> None:
-        mock_client = self._make_mock_client(stdout_data="hello\n", exit_code=0)
-        mock_ssh_cls.return_value = mock_client
+        mock_ssh_cls.return_value = _make_mock_client(stdout_data=b"hello\n", exit_code=0)
 
         ec, stdout, stderr = run_command("host", "echo hello")
 
         assert ec == 0
         assert "hello" in stdout
 
-    @patch("hozo.core.ssh.paramiko.SSHClient")
     def test_returns_nonzero_exit_code(self, mock_ssh_cls: MagicMock) -> None:
-        mock_client = self._make_mock_client(stderr_data="not found", exit_code=127)
-        mock_ssh_cls.return_value = mock_client
+        mock_ssh_cls.return_value = _make_mock_client(
+            stderr_data=b"not found", exit_code=127
+        )
 
         ec, stdout, stderr = run_command("host", "badcmd")
 
         assert ec == 127
         assert "not found" in stderr
 
-    @patch("hozo.core.ssh.paramiko.SSHClient")
+    def test_output_truncated_past_cap(self, mock_ssh_cls: MagicMock) -> None:
+        mock_ssh_cls.return_value = _make_mock_client(stdout_data="x" * 100, exit_code=0)
+
+        ec, stdout, stderr = run_command("host", "yes", max_output_bytes=10)
+
+        assert ec == 0
+        assert stdout.startswith("x" * 10)
+        assert "truncated" in stdout
+
+    def test_output_discarded_past_cap_across_chunks(self, mock_ssh_cls: MagicMock) -> None:
+        """Chunks past the cap are drained but never buffered."""
+        mock_client = _make_mock_client(exit_code=0)
+        mock_stdout = mock_client.exec_command.return_value[1]
+        mock_stdout.read.side_effect = [b"x" * 8, b"y" * 8, b"z" * 8, _EMPTY]
+        mock_ssh_cls.return_value = mock_client
+
+        ec, stdout, stderr = run_command("host", "yes", max_output_bytes=10)
+
+        assert stdout.startswith("x" * 8 + "y" * 2)
+        assert "z" not in stdout
+        assert "truncated" in stdout
+
     def test_client_closed_after_command(self, mock_ssh_cls: MagicMock) -> None:
-        mock_client = self._make_mock_client()
+        mock_client = _make_mock_client()
         mock_ssh_cls.return_value = mock_client
 
         run_command("host", "uptime")
@@ -88,38 +208,59 @@ class TestRunCommand:
         mock_client.close.assert_called_once()
 
 
+class TestRunCommandStream:
+    """Tests for run_command_stream via a scripted channel."""
+
+    def test_yields_stdout_and_stderr_in_order(
+        self, mock_ssh_cls: MagicMock, mock_select: MagicMock
+    ) -> None:
+        events = [("stdout", b"one"), ("stderr", b"warn"), ("stdout", b"two")]
+        mock_ssh_cls.return_value = _make_stream_client(_FakeChannel(events))
+
+        chunks = list(run_command_stream("host", "zfs send"))
+
+        assert chunks == events
+
+    def test_select_waits_with_one_second_timeout(
+        self, mock_ssh_cls: MagicMock, mock_select: MagicMock
+    ) -> None:
+        channel = _FakeChannel([("stdout", b"x")])
+        mock_ssh_cls.return_value = _make_stream_client(channel)
+
+        list(run_command_stream("host", "cmd"))
+
+        assert mock_select.call_args.args == ([channel], [], [], 1.0)
+
+    def test_terminates_when_drained_and_exit_ready(
+        self, mock_ssh_cls: MagicMock, mock_select: MagicMock
+    ) -> None:
+        mock_client = _make_stream_client(_FakeChannel([], exit_code=1))
+        mock_ssh_cls.return_value = mock_client
+
+        chunks = list(run_command_stream("host", "false"))
+
+        assert chunks == []
+        mock_client.close.assert_called_once()
+
+
 class TestRunCommandCredentials:
     """Cover key_path and password branches."""
 
-    def _make_mock_client(
-        self, stdout_data: str = "", stderr_data: str = "", exit_code: int = 0
-    ) -> MagicMock:
-        mock_stdout = MagicMock()
-        mock_stdout.read.return_value = stdout_data.encode()
-        mock_stdout.channel.recv_exit_status.return_value = exit_code
-        mock_stderr = MagicMock()
-        mock_stderr.read.return_value = stderr_data.encode()
-        mock_client = MagicMock()
-        mock_client.exec_command.return_value = (MagicMock(), mock_stdout, mock_stderr)
-        return mock_client
-
-    @patch("hozo.core.ssh.paramiko.SSHClient")
     def test_key_path_passed_to_connect(self, mock_ssh_cls: MagicMock) -> None:
-        mock_client = self._make_mock_client()
+        mock_client = _make_mock_client()
         mock_ssh_cls.return_value = mock_client
 
         run_command("host", "cmd", key_path="~/.ssh/id_ed25519")
 
-        call_kwargs = mock_client.connect.call_args[1]
-        assert "key_filename" in call_kwargs
-        assert "id_ed25519" in call_kwargs["key_filename"]
+        mock_client.connect.assert_called_once()
+        kwargs = mock_client.connect.call_args.kwargs
+        assert "id_ed25519" in kwargs["key_filename"]
 
-    @patch("hozo.core.ssh.paramiko.SSHClient")
     def test_password_passed_to_connect(self, mock_ssh_cls: MagicMock) -> None:
-        mock_client = self._make_mock_client()
+        mock_client = _make_mock_client()
         mock_ssh_cls.return_value = mock_client
 
         run_command("host", "cmd", password="hunter2")
 
-        call_kwargs = mock_client.connect.call_args[1]
-        assert call_kwargs.get("password") == "hunter2"
+        mock_client.connect.assert_called_once()
+        assert mock_client.connect.call_args.kwargs["password"] == "hunter2"
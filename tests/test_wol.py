@@ -2,49 +2,31 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from hozo.core.wol import wake
 
+_MAC = "AA:BB:CC:DD:EE:FF"
+
 
 class TestWake:
     """Tests for wake function."""
 
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, {"ip_address": "255.255.255.255", "port": 9}),
+            ({"ip_address": "192.168.1.255"}, {"ip_address": "192.168.1.255", "port": 9}),
+            ({"port": 7}, {"ip_address": "255.255.255.255", "port": 7}),
+        ],
+        ids=["defaults", "custom-broadcast", "custom-port"],
+    )
     @patch("hozo.core.wol.send_magic_packet")
-    def test_wake_sends_magic_packet(self, mock_send: object) -> None:
-        """Should call send_magic_packet with correct MAC."""
-        mac = "AA:BB:CC:DD:EE:FF"
-
-        result = wake(mac)
-
-        assert result is True
-        mock_send.assert_called_once_with(  # type: ignore[attr-defined]
-            mac, ip_address="255.255.255.255", port=9
-        )
-
-    @patch("hozo.core.wol.send_magic_packet")
-    def test_wake_custom_broadcast(self, mock_send: object) -> None:
-        """Should use custom broadcast IP when provided."""
-        mac = "AA:BB:CC:DD:EE:FF"
-        broadcast = "192.168.1.255"
+    def test_wake_passes_args_and_succeeds(
+        self, mock_send: object, kwargs: dict, expected: dict
+    ) -> None:
+        """Should forward MAC/broadcast/port to send_magic_packet and return True."""
+        result = wake(_MAC, **kwargs)
 
-        wake(mac, ip_address=broadcast)
-
-        mock_send.assert_called_once_with(  # type: ignore[attr-defined]
-            mac, ip_address=broadcast, port=9
-        )
-
-    @patch("hozo.core.wol.send_magic_packet")
-    def test_wake_custom_port(self, mock_send: object) -> None:
-        """Should use custom port when provided."""
-        mac = "AA:BB:CC:DD:EE:FF"
-
-        wake(mac, port=7)
-
-        mock_send.assert_called_once_with(  # type: ignore[attr-defined]
-            mac, ip_address="255.255.255.255", port=7
-        )
-
-    @patch("hozo.core.wol.send_magic_packet")
-    def test_wake_returns_true_on_success(self, mock_send: object) -> None:
-        """Should always return True on successful send."""
-        result = wake("11:22:33:44:55:66")
         assert result is True
+        mock_send.assert_called_once_with(_MAC, **expected)  # type: ignore[attr-defined]
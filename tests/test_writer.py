@@ -1,5 +1,8 @@
 """Tests for the YAML config writer."""
 
+import functools
+import os
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,17 +13,30 @@ from hozo.config.writer import build_config_dict, job_to_raw, write_config
 from hozo.core.job import BackupJob
 
 
-def _make_job(**kwargs) -> BackupJob:
-    defaults = dict(
-        name="test_job",
-        source_dataset="rpool/data",
-        target_host="backup.local",
-        target_dataset="backup/data",
-        mac_address="AA:BB:CC:DD:EE:FF",
-        schedule="weekly Sunday 03:00",
-    )
-    defaults.update(kwargs)
-    return BackupJob(**defaults)
+_MAC = "AA:BB:CC:DD:EE:FF"
+
+# One shared default job — the runners and writer never mutate their jobs,
+# so tests that only vary a field replace() off this base instead of
+# re-running the full dataclass constructor.
+_BASE_JOB = BackupJob(
+    name="test_job",
+    source_dataset="rpool/data",
+    target_host="backup.local",
+    target_dataset="backup/data",
+    mac_address=_MAC,
+    schedule="weekly Sunday 03:00",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_job(key: frozenset) -> BackupJob:
+    return replace(_BASE_JOB, **dict(key))
+
+
+def _make_job(**kwargs: object) -> BackupJob:
+    """Build (or reuse) a job — identical kwarg sets share one cached
+    instance across the session, as in test_job."""
+    return _cached_job(frozenset(kwargs.items())) if kwargs else _BASE_JOB
 
 
 class TestJobToRaw:
@@ -59,62 +75,81 @@ class TestJobToRaw:
         assert raw["disk_spinup_timeout"] == 120
 
 
-class TestWriteConfig:
-    def test_write_and_reload(self, tmp_path: Path) -> None:
-        cfg = {
-            "jobs": [
-                {
-                    "name": "test",
-                    "source": "rpool/data",
-                    "target_host": "h",
-                    "target_dataset": "b/d",
-                    "mac_address": "AA:BB:CC:DD:EE:FF",
-                }
-            ]
+# Roundtrip cases built once at collection: a hand-written minimal config
+# and one produced by build_config_dict.
+_MINIMAL_CFG = {
+    "jobs": [
+        {
+            "name": "test",
+            "source": "rpool/data",
+            "target_host": "h",
+            "target_dataset": "b/d",
+            "mac_address": _MAC,
         }
-        p = tmp_path / "config.yaml"
+    ]
+}
+_ROUNDTRIP_CASES = [
+    (_MINIMAL_CFG, "name", "test"),
+    (build_config_dict([_make_job(schedule="daily 04:00")]), "schedule", "daily 04:00"),
+]
+
+
+@pytest.fixture(scope="class")
+def cls_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One writable directory per class — the write tests target distinct
+    filenames, so per-test tmp_path mkdir/teardown is wasted work."""
+    return tmp_path_factory.mktemp("writer")
+
+
+class TestWriteConfig:
+    @pytest.mark.parametrize(
+        ("cfg", "key", "expected"), _ROUNDTRIP_CASES, ids=["minimal", "built"]
+    )
+    def test_write_and_reload(
+        self, cls_tmp: Path, cfg: dict, key: str, expected: str
+    ) -> None:
+        p = cls_tmp / f"roundtrip-{key}.yaml"
         write_config(p, cfg)
         loaded = load_config(p)
         assert loaded is not None
-        assert loaded["jobs"][0]["name"] == "test"
+        assert loaded["jobs"][0][key] == expected
 
     def test_atomic_write_creates_no_tmp_on_success(self, tmp_path: Path) -> None:
+        # Own tmp_path: the assertion lists the whole directory
         p = tmp_path / "config.yaml"
         write_config(p, {"jobs": []})
-        assert not (tmp_path / "config.yaml.tmp").exists()
+        # One directory listing checks both "config written" and "no .tmp left"
+        assert os.listdir(tmp_path) == ["config.yaml"]
 
-    def test_write_preserves_unicode(self, tmp_path: Path) -> None:
-        p = tmp_path / "config.yaml"
+    def test_write_preserves_unicode(self, cls_tmp: Path) -> None:
+        p = cls_tmp / "unicode.yaml"
         write_config(p, {"jobs": [], "description": "宝蔵"})
         text = p.read_text(encoding="utf-8")
         assert "宝蔵" in text
 
 
 class TestBuildConfigDict:
-    def test_structure(self) -> None:
-        jobs = [_make_job()]
-        settings = {"ssh_timeout": 60, "ssh_user": "admin"}
-        auth = {"session_secret": "abc", "credentials": []}
-        cfg = build_config_dict(jobs, settings=settings, auth=auth)
-        assert "jobs" in cfg
-        assert "settings" in cfg
-        assert "auth" in cfg
-        assert cfg["settings"]["ssh_timeout"] == 60
-
-    def test_no_settings_or_auth_omitted(self) -> None:
-        cfg = build_config_dict([_make_job()])
-        assert "settings" not in cfg
-        assert "auth" not in cfg
+    @pytest.mark.parametrize(
+        ("settings", "auth", "expected_keys"),
+        [
+            (
+                {"ssh_timeout": 60, "ssh_user": "admin"},
+                {"session_secret": "abc", "credentials": []},
+                {"jobs", "settings", "auth"},
+            ),
+            (None, None, {"jobs"}),
+        ],
+        ids=["full", "jobs-only"],
+    )
+    def test_structure(
+        self, settings: "dict | None", auth: "dict | None", expected_keys: set
+    ) -> None:
+        cfg = build_config_dict([_make_job()], settings=settings, auth=auth)
+        # Exact key set: optional sections present iff provided
+        assert set(cfg) == expected_keys
         assert len(cfg["jobs"]) == 1
-
-    def test_roundtrip_through_yaml(self, tmp_path: Path) -> None:
-        jobs = [_make_job(schedule="daily 04:00")]
-        cfg = build_config_dict(jobs)
-        p = tmp_path / "config.yaml"
-        write_config(p, cfg)
-        loaded = load_config(p)
-        assert loaded is not None
-        assert loaded["jobs"][0]["schedule"] == "daily 04:00"
+        if settings:
+            assert cfg["settings"]["ssh_timeout"] == 60
 
 
 class TestWriteConfigException:
@@ -125,9 +160,8 @@ class TestWriteConfigException:
             with pytest.raises(RuntimeError, match="disk full"):
                 write_config(p, {"jobs": []})
 
-        # The .tmp file must NOT be left behind
-        tmp_file = p.parent / (p.name + ".tmp")
-        assert not tmp_file.exists()
+        # The .tmp file must NOT be left behind — the directory stays empty
+        assert os.listdir(tmp_path) == []
 
     def test_original_file_unchanged_on_error(self, tmp_path: Path) -> None:
         """If write fails, any pre-existing file is not overwritten."""